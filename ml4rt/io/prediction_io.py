@@ -437,6 +437,55 @@ def read_file(netcdf_file_name):
     return prediction_dict
 
 
+def read_one_target_field(netcdf_file_name, channel_index, height_index=None):
+    """Reads predicted and actual values of one target field from NetCDF file.
+
+    This is much faster than `read_file` when only one field (scalar, or vector
+    at one height) is needed, because only that slice is read from disk.
+
+    E = number of examples
+
+    :param netcdf_file_name: Path to input file.
+    :param channel_index: Channel index of target field.
+    :param height_index: Height index of target field.  If None, will assume
+        that target field is a scalar.
+    :return: predicted_values: length-E numpy array of predicted values.
+    :return: actual_values: length-E numpy array of actual values.
+    :return: example_id_strings: length-E list of example IDs.
+    """
+
+    error_checking.assert_is_integer(channel_index)
+    error_checking.assert_is_geq(channel_index, 0)
+    if height_index is not None:
+        error_checking.assert_is_integer(height_index)
+        error_checking.assert_is_geq(height_index, 0)
+
+    dataset_object = netCDF4.Dataset(netcdf_file_name)
+
+    if height_index is None:
+        predicted_values = dataset_object.variables[SCALAR_PREDICTIONS_KEY][
+            :, channel_index
+        ]
+        actual_values = dataset_object.variables[SCALAR_TARGETS_KEY][
+            :, channel_index
+        ]
+    else:
+        predicted_values = dataset_object.variables[VECTOR_PREDICTIONS_KEY][
+            :, height_index, channel_index
+        ]
+        actual_values = dataset_object.variables[VECTOR_TARGETS_KEY][
+            :, height_index, channel_index
+        ]
+
+    example_id_strings = [
+        str(id) for id in
+        netCDF4.chartostring(dataset_object.variables[EXAMPLE_IDS_KEY][:])
+    ]
+
+    dataset_object.close()
+    return predicted_values, actual_values, example_id_strings
+
+
 def find_grid_metafile(prediction_dir_name, raise_error_if_missing=True):
     """Finds file with metadata for grid.
 
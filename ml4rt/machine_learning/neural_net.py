@@ -210,6 +210,41 @@ def _check_inference_args(predictor_matrix, num_examples_per_batch, verbose):
     return num_examples_per_batch
 
 
+def _read_examples_for_normalization(
+        normalization_file_name, heights_m_agl, predictor_norm_type_string,
+        vector_target_norm_type_string, scalar_target_norm_type_string):
+    """Reads training examples used for normalization.
+
+    :param normalization_file_name: See doc for `data_generator`.
+    :param heights_m_agl: Same.
+    :param predictor_norm_type_string: Same.
+    :param vector_target_norm_type_string: Same.
+    :param scalar_target_norm_type_string: Same.
+    :return: training_example_dict: Dictionary in format returned by
+        `example_io.read_file`, containing only the desired heights.  If
+        nothing is to be normalized, this is None and the file is not read.
+    """
+
+    norm_type_strings = [
+        predictor_norm_type_string, vector_target_norm_type_string,
+        scalar_target_norm_type_string
+    ]
+
+    if all([t is None for t in norm_type_strings]):
+        return None
+
+    print((
+        'Reading training examples (for normalization) from: "{0:s}"...'
+    ).format(
+        normalization_file_name
+    ))
+    training_example_dict = example_io.read_file(normalization_file_name)
+
+    return example_utils.subset_by_height(
+        example_dict=training_example_dict, heights_m_agl=heights_m_agl
+    )
+
+
 def _read_file_for_generator(
         example_file_name, first_time_unix_sec, last_time_unix_sec, field_names,
         heights_m_agl, min_column_lwp_kg_m02, max_column_lwp_kg_m02,
@@ -1111,14 +1146,12 @@ def data_generator(option_dict, for_inference, net_type_string):
     scalar_target_min_norm_value = option_dict[SCALAR_TARGET_MIN_VALUE_KEY]
     scalar_target_max_norm_value = option_dict[SCALAR_TARGET_MAX_VALUE_KEY]
 
-    print((
-        'Reading training examples (for normalization) from: "{0:s}"...'
-    ).format(
-        normalization_file_name
-    ))
-    training_example_dict = example_io.read_file(normalization_file_name)
-    training_example_dict = example_utils.subset_by_height(
-        example_dict=training_example_dict, heights_m_agl=heights_m_agl
+    training_example_dict = _read_examples_for_normalization(
+        normalization_file_name=normalization_file_name,
+        heights_m_agl=heights_m_agl,
+        predictor_norm_type_string=predictor_norm_type_string,
+        vector_target_norm_type_string=vector_target_norm_type_string,
+        scalar_target_norm_type_string=scalar_target_norm_type_string
     )
 
     example_file_names = example_io.find_many_files(
@@ -1302,14 +1335,12 @@ def create_data(option_dict, for_inference, net_type_string,
     scalar_target_min_norm_value = option_dict[SCALAR_TARGET_MIN_VALUE_KEY]
     scalar_target_max_norm_value = option_dict[SCALAR_TARGET_MAX_VALUE_KEY]
 
-    print((
-        'Reading training examples (for normalization) from: "{0:s}"...'
-    ).format(
-        normalization_file_name
-    ))
-    training_example_dict = example_io.read_file(normalization_file_name)
-    training_example_dict = example_utils.subset_by_height(
-        example_dict=training_example_dict, heights_m_agl=heights_m_agl
+    training_example_dict = _read_examples_for_normalization(
+        normalization_file_name=normalization_file_name,
+        heights_m_agl=heights_m_agl,
+        predictor_norm_type_string=predictor_norm_type_string,
+        vector_target_norm_type_string=vector_target_norm_type_string,
+        scalar_target_norm_type_string=scalar_target_norm_type_string
     )
 
     example_file_names = example_io.find_many_files(
@@ -1425,14 +1456,12 @@ def data_generator_specific_examples(option_dict, net_type_string,
     scalar_target_min_norm_value = option_dict[SCALAR_TARGET_MIN_VALUE_KEY]
     scalar_target_max_norm_value = option_dict[SCALAR_TARGET_MAX_VALUE_KEY]
 
-    print((
-        'Reading training examples (for normalization) from: "{0:s}"...'
-    ).format(
-        normalization_file_name
-    ))
-    training_example_dict = example_io.read_file(normalization_file_name)
-    training_example_dict = example_utils.subset_by_height(
-        example_dict=training_example_dict, heights_m_agl=heights_m_agl
+    training_example_dict = _read_examples_for_normalization(
+        normalization_file_name=normalization_file_name,
+        heights_m_agl=heights_m_agl,
+        predictor_norm_type_string=predictor_norm_type_string,
+        vector_target_norm_type_string=vector_target_norm_type_string,
+        scalar_target_norm_type_string=scalar_target_norm_type_string
     )
 
     example_file_names = example_io.find_many_files(
@@ -1574,14 +1603,12 @@ def create_data_specific_examples(
     scalar_target_min_norm_value = option_dict[SCALAR_TARGET_MIN_VALUE_KEY]
     scalar_target_max_norm_value = option_dict[SCALAR_TARGET_MAX_VALUE_KEY]
 
-    print((
-        'Reading training examples (for normalization) from: "{0:s}"...'
-    ).format(
-        normalization_file_name
-    ))
-    training_example_dict = example_io.read_file(normalization_file_name)
-    training_example_dict = example_utils.subset_by_height(
-        example_dict=training_example_dict, heights_m_agl=heights_m_agl
+    training_example_dict = _read_examples_for_normalization(
+        normalization_file_name=normalization_file_name,
+        heights_m_agl=heights_m_agl,
+        predictor_norm_type_string=predictor_norm_type_string,
+        vector_target_norm_type_string=vector_target_norm_type_string,
+        scalar_target_norm_type_string=scalar_target_norm_type_string
     )
 
     example_file_names = example_io.find_many_files(
@@ -2086,10 +2113,6 @@ def apply_model(
         this_last_index = min(
             [i + num_examples_per_batch - 1, num_examples - 1]
         )
-        these_indices = numpy.linspace(
-            this_first_index, this_last_index,
-            num=this_last_index - this_first_index + 1, dtype=int
-        )
 
         if verbose:
             print((
@@ -2099,8 +2122,11 @@ def apply_model(
                 this_first_index + 1, this_last_index + 1, num_examples
             ))
 
+        # Slicing (rather than indexing with an array) returns a view, so the
+        # batch is not copied before being fed to the model.
         this_output = model_object.predict(
-            predictor_matrix[these_indices, ...], batch_size=len(these_indices)
+            predictor_matrix[this_first_index:(this_last_index + 1), ...],
+            batch_size=this_last_index - this_first_index + 1
         )
 
         if not isinstance(this_output, list):
@@ -2165,11 +2191,6 @@ def get_feature_maps(
             [i + num_examples_per_batch - 1, num_examples - 1]
         )
 
-        these_indices = numpy.linspace(
-            this_first_index, this_last_index,
-            num=this_last_index - this_first_index + 1, dtype=int
-        )
-
         if verbose:
             print((
                 'Creating feature maps for examples {0:d}-{1:d} of {2:d}...'
@@ -2178,7 +2199,8 @@ def get_feature_maps(
             ))
 
         this_feature_matrix = partial_model_object.predict(
-            predictor_matrix[these_indices, ...], batch_size=len(these_indices)
+            predictor_matrix[this_first_index:(this_last_index + 1), ...],
+            batch_size=this_last_index - this_first_index + 1
         )
 
         if feature_matrix is None:
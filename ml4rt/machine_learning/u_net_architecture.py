@@ -25,6 +25,19 @@ OUTPUT_ACTIV_FUNCTION_ALPHA_KEY = 'output_activ_function_alpha'
 L1_WEIGHT_KEY = 'l1_weight'
 L2_WEIGHT_KEY = 'l2_weight'
 USE_BATCH_NORM_KEY = 'use_batch_normalization'
+USE_MIXED_PRECISION_KEY = 'use_mixed_precision'
+USE_TRANSPOSED_UPCONV_KEY = 'use_transposed_upconv'
+USE_XLA_KEY = 'use_xla_compilation'
+USE_SEPARABLE_CONV_KEY = 'use_separable_conv'
+
+STANDARD_CONV_TYPE_STRING = 'standard'
+TRANSPOSED_CONV_TYPE_STRING = 'transposed'
+SEPARABLE_CONV_TYPE_STRING = 'separable'
+
+MAX_CHANNELS_FOR_SEPARABLE_CONV = 128
+
+MIXED_PRECISION_POLICY_STRING = 'mixed_float16'
+FULL_PRECISION_POLICY_STRING = 'float32'
 
 DEFAULT_ARCHITECTURE_OPTION_DICT = {
     NUM_LEVELS_KEY: 4,
@@ -43,7 +56,11 @@ DEFAULT_ARCHITECTURE_OPTION_DICT = {
     OUTPUT_ACTIV_FUNCTION_ALPHA_KEY: 0.,
     L1_WEIGHT_KEY: 0.,
     L2_WEIGHT_KEY: 0.001,
-    USE_BATCH_NORM_KEY: True
+    USE_BATCH_NORM_KEY: True,
+    USE_MIXED_PRECISION_KEY: False,
+    USE_TRANSPOSED_UPCONV_KEY: False,
+    USE_XLA_KEY: False,
+    USE_SEPARABLE_CONV_KEY: False
 }
 
 
@@ -88,6 +105,20 @@ def _check_args(option_dict):
     option_dict['l2_weight']: Weight for L_2 regularization.
     option_dict['use_batch_normalization']: Boolean flag.  If True, will use
         batch normalization after each inner (non-output) conv layer.
+    option_dict['use_mixed_precision']: Boolean flag.  If True, inner layers
+        will use mixed precision (16-bit computations with 32-bit weights).
+        Output layers always use full (32-bit) precision.
+    option_dict['use_transposed_upconv']: Boolean flag.  If True, each upconv
+        layer will be a transposed conv with stride 2.  If False, each upconv
+        layer will be upsampling followed by a conv with stride 1.
+    option_dict['use_xla_compilation']: Boolean flag.  If True, will compile
+        model with XLA, which fuses adjacent operations (e.g., conv,
+        activation, batch normalization) into single kernels.
+    option_dict['use_separable_conv']: Boolean flag.  If True, encoder and
+        skip-connection conv layers with <= `MAX_CHANNELS_FOR_SEPARABLE_CONV`
+        output channels will be depthwise-separable.  These layers are at the
+        highest-resolution levels, where standard convs are most
+        memory-bound.
 
     :return: option_dict: Same as input, except defaults may have been added.
     """
@@ -180,10 +211,86 @@ def _check_args(option_dict):
     error_checking.assert_is_geq(option_dict[L1_WEIGHT_KEY], 0.)
     error_checking.assert_is_geq(option_dict[L2_WEIGHT_KEY], 0.)
     error_checking.assert_is_boolean(option_dict[USE_BATCH_NORM_KEY])
+    error_checking.assert_is_boolean(option_dict[USE_MIXED_PRECISION_KEY])
+    error_checking.assert_is_boolean(option_dict[USE_TRANSPOSED_UPCONV_KEY])
+    error_checking.assert_is_boolean(option_dict[USE_XLA_KEY])
+    error_checking.assert_is_boolean(option_dict[USE_SEPARABLE_CONV_KEY])
 
     return option_dict
 
 
+def _get_conv_block(
+        input_layer_object, num_kernel_rows, num_filters, dropout_rate,
+        regularizer_object, activ_function_name, activ_function_alpha,
+        use_batch_normalization, basic_layer_name,
+        conv_type_string=STANDARD_CONV_TYPE_STRING):
+    """Creates conv block (conv, activation, dropout, batch normalization).
+
+    :param input_layer_object: Input to block (instance of
+        `keras.layers.Layer`).
+    :param num_kernel_rows: Number of rows in convolutional filter.
+    :param num_filters: Number of filters (output channels).
+    :param dropout_rate: Dropout rate.  If this is not positive, will not use
+        dropout.
+    :param regularizer_object: Weight regularizer (instance of
+        `keras.regularizers.l1_l2`).
+    :param activ_function_name: Name of activation function.  Must be accepted
+        by `architecture_utils.check_activation_function`.
+    :param activ_function_alpha: Alpha (slope parameter) for activation
+        function.  Applies only to ReLU and eLU.
+    :param use_batch_normalization: Boolean flag.  If True, will use batch
+        normalization at end of block.
+    :param basic_layer_name: Name of conv layer.  Names of other layers in the
+        block will be derived from this.
+    :param conv_type_string: Type of conv layer.  If "standard", will use conv
+        layer with stride 1.  If "transposed", will use transposed conv layer
+        with stride 2, which doubles the number of heights.  If "separable",
+        will use depthwise-separable conv layer with stride 1.
+    :return: output_layer_object: Output of block (instance of
+        `keras.layers.Layer`).
+    """
+
+    if conv_type_string == TRANSPOSED_CONV_TYPE_STRING:
+        output_layer_object = keras.layers.Conv1DTranspose(
+            filters=num_filters, kernel_size=num_kernel_rows, strides=2,
+            padding='same', kernel_regularizer=regularizer_object,
+            name=basic_layer_name
+        )(input_layer_object)
+    elif conv_type_string == SEPARABLE_CONV_TYPE_STRING:
+        output_layer_object = keras.layers.SeparableConv1D(
+            filters=num_filters, kernel_size=num_kernel_rows, strides=1,
+            padding='same', depthwise_regularizer=regularizer_object,
+            pointwise_regularizer=regularizer_object, name=basic_layer_name
+        )(input_layer_object)
+    else:
+        output_layer_object = architecture_utils.get_1d_conv_layer(
+            num_kernel_rows=num_kernel_rows, num_rows_per_stride=1,
+            num_filters=num_filters,
+            padding_type_string=architecture_utils.YES_PADDING_STRING,
+            weight_regularizer=regularizer_object, layer_name=basic_layer_name
+        )(input_layer_object)
+
+    output_layer_object = architecture_utils.get_activation_layer(
+        activation_function_string=activ_function_name,
+        alpha_for_relu=activ_function_alpha,
+        alpha_for_elu=activ_function_alpha,
+        layer_name='{0:s}_activation'.format(basic_layer_name)
+    )(output_layer_object)
+
+    if dropout_rate > 0:
+        output_layer_object = architecture_utils.get_dropout_layer(
+            dropout_fraction=dropout_rate,
+            layer_name='{0:s}_dropout'.format(basic_layer_name)
+        )(output_layer_object)
+
+    if use_batch_normalization:
+        output_layer_object = architecture_utils.get_batch_norm_layer(
+            layer_name='{0:s}_bn'.format(basic_layer_name)
+        )(output_layer_object)
+
+    return output_layer_object
+
+
 def zero_top_heating_rate_function(heating_rate_channel_index, height_index):
     """Returns function that zeroes predicted heating rate at top of profile.
 
@@ -247,23 +354,15 @@ def zero_top_heating_rate_function(heating_rate_channel_index, height_index):
     return zeroing_function
 
 
-def create_model(option_dict, vector_loss_function, num_output_channels=1,
-                 scalar_loss_function=None):
-    """Creates U-net.
+def _create_model(option_dict, vector_loss_function, num_output_channels,
+                  scalar_loss_function):
+    """Does the work for `create_model`, without restoring the dtype policy.
 
-    This method sets up the architecture, loss function, and optimizer -- and
-    compiles the model -- but does not train it.
-
-    Architecture taken from:
-    https://github.com/zhixuhao/unet/blob/master/model.py
-
-    :param option_dict: See doc for `_check_architecture_args`.
-    :param vector_loss_function: Loss function for vector outputs.
-    :param num_output_channels: Number of output channels.
-    :param scalar_loss_function: Loss function scalar outputs.  If there are no
-        dense layers, leave this alone.
-    :return: model_object: Instance of `keras.models.Model`, with the
-        aforementioned architecture.
+    :param option_dict: See doc for `create_model`.
+    :param vector_loss_function: Same.
+    :param num_output_channels: Same.
+    :param scalar_loss_function: Same.
+    :return: model_object: Same.
     """
 
     option_dict = _check_args(option_dict)
@@ -286,9 +385,23 @@ def create_model(option_dict, vector_loss_function, num_output_channels=1,
     l1_weight = option_dict[L1_WEIGHT_KEY]
     l2_weight = option_dict[L2_WEIGHT_KEY]
     use_batch_normalization = option_dict[USE_BATCH_NORM_KEY]
+    use_mixed_precision = option_dict[USE_MIXED_PRECISION_KEY]
+    use_transposed_upconv = option_dict[USE_TRANSPOSED_UPCONV_KEY]
+    use_xla_compilation = option_dict[USE_XLA_KEY]
+    use_separable_conv = option_dict[USE_SEPARABLE_CONV_KEY]
 
     has_dense_layers = dense_layer_neuron_nums is not None
 
+    # The whole architecture assumes that channels are the last axis (heights
+    # are the second axis, and skip connections are concatenated along the last
+    # axis).  This is also the fastest layout for cuDNN on modern GPUs.
+    K.set_image_data_format('channels_last')
+
+    # Each layer takes its dtype policy from the global policy at the time the
+    # layer is created.
+    if use_mixed_precision:
+        keras.mixed_precision.set_global_policy(MIXED_PRECISION_POLICY_STRING)
+
     input_layer_object = keras.layers.Input(
         shape=tuple(input_dimensions.tolist())
     )
@@ -296,50 +409,36 @@ def create_model(option_dict, vector_loss_function, num_output_channels=1,
         l1_weight=l1_weight, l2_weight=l2_weight
     )
 
+    conv_type_string_by_level = [STANDARD_CONV_TYPE_STRING] * (num_levels + 1)
+
+    if use_separable_conv:
+        for i in range(num_levels + 1):
+            if num_channels_by_level[i] > MAX_CHANNELS_FOR_SEPARABLE_CONV:
+                continue
+
+            conv_type_string_by_level[i] = SEPARABLE_CONV_TYPE_STRING
+
     conv_layer_by_level = [None] * (num_levels + 1)
     pooling_layer_by_level = [None] * num_levels
 
     for i in range(num_levels + 1):
-        for k in range(num_conv_layers_by_level[i]):
-            if k == 0:
-                if i == 0:
-                    this_input_layer_object = input_layer_object
-                else:
-                    this_input_layer_object = pooling_layer_by_level[i - 1]
-            else:
-                this_input_layer_object = conv_layer_by_level[i]
-
-            this_name = 'block{0:d}_conv{1:d}'.format(i, k)
-            conv_layer_by_level[i] = architecture_utils.get_1d_conv_layer(
-                num_kernel_rows=3, num_rows_per_stride=1,
-                num_filters=num_channels_by_level[i],
-                padding_type_string=architecture_utils.YES_PADDING_STRING,
-                weight_regularizer=regularizer_object, layer_name=this_name
-            )(this_input_layer_object)
-
-            this_name = 'block{0:d}_conv{1:d}_activation'.format(i, k)
-            conv_layer_by_level[i] = architecture_utils.get_activation_layer(
-                activation_function_string=inner_activ_function_name,
-                alpha_for_relu=inner_activ_function_alpha,
-                alpha_for_elu=inner_activ_function_alpha, layer_name=this_name
-            )(conv_layer_by_level[i])
-
-            if encoder_dropout_rate_by_level[i] > 0:
-                this_name = 'block{0:d}_conv{1:d}_dropout'.format(i, k)
-
-                conv_layer_by_level[i] = architecture_utils.get_dropout_layer(
-                    dropout_fraction=encoder_dropout_rate_by_level[i],
-                    layer_name=this_name
-                )(conv_layer_by_level[i])
-
-            if use_batch_normalization:
-                this_name = 'block{0:d}_conv{1:d}_bn'.format(i, k)
+        if i == 0:
+            conv_layer_by_level[i] = input_layer_object
+        else:
+            conv_layer_by_level[i] = pooling_layer_by_level[i - 1]
 
-                conv_layer_by_level[i] = (
-                    architecture_utils.get_batch_norm_layer(
-                        layer_name=this_name
-                    )(conv_layer_by_level[i])
-                )
+        for k in range(num_conv_layers_by_level[i]):
+            conv_layer_by_level[i] = _get_conv_block(
+                input_layer_object=conv_layer_by_level[i],
+                num_kernel_rows=3, num_filters=num_channels_by_level[i],
+                dropout_rate=encoder_dropout_rate_by_level[i],
+                regularizer_object=regularizer_object,
+                activ_function_name=inner_activ_function_name,
+                activ_function_alpha=inner_activ_function_alpha,
+                use_batch_normalization=use_batch_normalization,
+                basic_layer_name='block{0:d}_conv{1:d}'.format(i, k),
+                conv_type_string=conv_type_string_by_level[i]
+            )
 
         if i == num_levels:
             break
@@ -361,40 +460,35 @@ def create_model(option_dict, vector_loss_function, num_output_channels=1,
     )[::-1]
 
     for i in level_indices:
-        this_name = 'block{0:d}_upsampling'.format(i)
-
         if i == num_levels - 1:
-            upconv_layer_by_level[i] = keras.layers.UpSampling1D(
-                size=2, name=this_name
-            )(conv_layer_by_level[i + 1])
+            upconv_layer_by_level[i] = conv_layer_by_level[i + 1]
         else:
-            upconv_layer_by_level[i] = keras.layers.UpSampling1D(
-                size=2, name=this_name
-            )(skip_layer_by_level[i + 1])
+            upconv_layer_by_level[i] = skip_layer_by_level[i + 1]
 
-        this_name = 'block{0:d}_upconv'.format(i)
-        upconv_layer_by_level[i] = architecture_utils.get_1d_conv_layer(
-            num_kernel_rows=2, num_rows_per_stride=1,
-            num_filters=num_channels_by_level[i],
-            padding_type_string=architecture_utils.YES_PADDING_STRING,
-            weight_regularizer=regularizer_object, layer_name=this_name
-        )(upconv_layer_by_level[i])
-
-        this_name = 'block{0:d}_upconv_activation'.format(i)
-        upconv_layer_by_level[i] = architecture_utils.get_activation_layer(
-            activation_function_string=inner_activ_function_name,
-            alpha_for_relu=inner_activ_function_alpha,
-            alpha_for_elu=inner_activ_function_alpha, layer_name=this_name
-        )(upconv_layer_by_level[i])
-
-        if upconv_dropout_rate_by_level[i] > 0:
-            this_name = 'block{0:d}_upconv_dropout'.format(i)
+        # A transposed conv does the upsampling itself, without creating the
+        # intermediate (upsampled but not convolved) tensor.
+        if use_transposed_upconv:
+            this_conv_type_string = TRANSPOSED_CONV_TYPE_STRING
+        else:
+            this_conv_type_string = STANDARD_CONV_TYPE_STRING
 
-            upconv_layer_by_level[i] = architecture_utils.get_dropout_layer(
-                dropout_fraction=upconv_dropout_rate_by_level[i],
-                layer_name=this_name
+            this_name = 'block{0:d}_upsampling'.format(i)
+            upconv_layer_by_level[i] = keras.layers.UpSampling1D(
+                size=2, name=this_name
             )(upconv_layer_by_level[i])
 
+        upconv_layer_by_level[i] = _get_conv_block(
+            input_layer_object=upconv_layer_by_level[i],
+            num_kernel_rows=2, num_filters=num_channels_by_level[i],
+            dropout_rate=upconv_dropout_rate_by_level[i],
+            regularizer_object=regularizer_object,
+            activ_function_name=inner_activ_function_name,
+            activ_function_alpha=inner_activ_function_alpha,
+            use_batch_normalization=False,
+            basic_layer_name='block{0:d}_upconv'.format(i),
+            conv_type_string=this_conv_type_string
+        )
+
         num_upconv_heights = upconv_layer_by_level[i].get_shape()[1]
         num_desired_heights = conv_layer_by_level[i].get_shape()[1]
 
@@ -412,69 +506,37 @@ def create_model(option_dict, vector_loss_function, num_output_channels=1,
             [conv_layer_by_level[i], upconv_layer_by_level[i]]
         )
 
-        for k in range(num_conv_layers_by_level[i]):
-            if k == 0:
-                this_input_layer_object = merged_layer_by_level[i]
-            else:
-                this_input_layer_object = skip_layer_by_level[i]
-
-            this_name = 'block{0:d}_skipconv{1:d}'.format(i, k)
-            skip_layer_by_level[i] = architecture_utils.get_1d_conv_layer(
-                num_kernel_rows=3, num_rows_per_stride=1,
-                num_filters=num_channels_by_level[i],
-                padding_type_string=architecture_utils.YES_PADDING_STRING,
-                weight_regularizer=regularizer_object, layer_name=this_name
-            )(this_input_layer_object)
-
-            this_name = 'block{0:d}_skipconv{1:d}_activation'.format(i, k)
-            skip_layer_by_level[i] = architecture_utils.get_activation_layer(
-                activation_function_string=inner_activ_function_name,
-                alpha_for_relu=inner_activ_function_alpha,
-                alpha_for_elu=inner_activ_function_alpha, layer_name=this_name
-            )(skip_layer_by_level[i])
-
-            if skip_dropout_rate_by_level[i] > 0:
-                this_name = 'block{0:d}_skipconv{1:d}_dropout'.format(i, k)
-
-                skip_layer_by_level[i] = architecture_utils.get_dropout_layer(
-                    dropout_fraction=skip_dropout_rate_by_level[i],
-                    layer_name=this_name
-                )(skip_layer_by_level[i])
+        skip_layer_by_level[i] = merged_layer_by_level[i]
 
-            if use_batch_normalization:
-                this_name = 'block{0:d}_skipconv{1:d}_bn'.format(i, k)
-
-                skip_layer_by_level[i] = (
-                    architecture_utils.get_batch_norm_layer(
-                        layer_name=this_name
-                    )(skip_layer_by_level[i])
-                )
+        for k in range(num_conv_layers_by_level[i]):
+            skip_layer_by_level[i] = _get_conv_block(
+                input_layer_object=skip_layer_by_level[i],
+                num_kernel_rows=3, num_filters=num_channels_by_level[i],
+                dropout_rate=skip_dropout_rate_by_level[i],
+                regularizer_object=regularizer_object,
+                activ_function_name=inner_activ_function_name,
+                activ_function_alpha=inner_activ_function_alpha,
+                use_batch_normalization=use_batch_normalization,
+                basic_layer_name='block{0:d}_skipconv{1:d}'.format(i, k),
+                conv_type_string=conv_type_string_by_level[i]
+            )
 
     if include_penultimate_conv:
-        skip_layer_by_level[0] = architecture_utils.get_1d_conv_layer(
-            num_kernel_rows=3, num_rows_per_stride=1,
-            num_filters=2 * num_output_channels,
-            padding_type_string=architecture_utils.YES_PADDING_STRING,
-            weight_regularizer=regularizer_object, layer_name='penultimate_conv'
-        )(skip_layer_by_level[0])
-
-        skip_layer_by_level[0] = architecture_utils.get_activation_layer(
-            activation_function_string=inner_activ_function_name,
-            alpha_for_relu=inner_activ_function_alpha,
-            alpha_for_elu=inner_activ_function_alpha,
-            layer_name='penultimate_conv_activation'
-        )(skip_layer_by_level[0])
-
-        if penultimate_conv_dropout_rate > 0:
-            skip_layer_by_level[0] = architecture_utils.get_dropout_layer(
-                dropout_fraction=penultimate_conv_dropout_rate,
-                layer_name='penultimate_conv_dropout'
-            )(skip_layer_by_level[0])
-
-        if use_batch_normalization:
-            skip_layer_by_level[0] = architecture_utils.get_batch_norm_layer(
-                layer_name='penultimate_conv_bn'
-            )(skip_layer_by_level[0])
+        skip_layer_by_level[0] = _get_conv_block(
+            input_layer_object=skip_layer_by_level[0],
+            num_kernel_rows=3, num_filters=2 * num_output_channels,
+            dropout_rate=penultimate_conv_dropout_rate,
+            regularizer_object=regularizer_object,
+            activ_function_name=inner_activ_function_name,
+            activ_function_alpha=inner_activ_function_alpha,
+            use_batch_normalization=use_batch_normalization,
+            basic_layer_name='penultimate_conv'
+        )
+
+    # Output layers (and the loss computed from them) stay in full precision,
+    # for the sake of numerical stability.
+    if use_mixed_precision:
+        keras.mixed_precision.set_global_policy(FULL_PRECISION_POLICY_STRING)
 
     conv_output_layer_object = architecture_utils.get_1d_conv_layer(
         num_kernel_rows=1, num_rows_per_stride=1,
@@ -569,21 +631,69 @@ def create_model(option_dict, vector_loss_function, num_output_channels=1,
             inputs=input_layer_object, outputs=conv_output_layer_object
         )
 
+    optimizer_object = keras.optimizers.Adam()
+
+    # Loss-scaling prevents small gradients from underflowing to zero in 16-bit
+    # precision.
+    if use_mixed_precision:
+        optimizer_object = keras.mixed_precision.LossScaleOptimizer(
+            optimizer_object
+        )
+
     if has_dense_layers:
-        loss_dict = {
+        loss_function_or_dict = {
             'conv_output': vector_loss_function,
             'dense_output': scalar_loss_function
         }
+    else:
+        loss_function_or_dict = vector_loss_function
 
+    # The `jit_compile` argument is passed only when needed, so that models
+    # without XLA can still be compiled by older versions of Keras.
+    if use_xla_compilation:
         model_object.compile(
-            loss=loss_dict, optimizer=keras.optimizers.Adam(),
-            metrics=neural_net.METRIC_FUNCTION_LIST
+            loss=loss_function_or_dict, optimizer=optimizer_object,
+            metrics=neural_net.METRIC_FUNCTION_LIST, jit_compile=True
         )
     else:
         model_object.compile(
-            loss=vector_loss_function, optimizer=keras.optimizers.Adam(),
+            loss=loss_function_or_dict, optimizer=optimizer_object,
             metrics=neural_net.METRIC_FUNCTION_LIST
         )
 
     model_object.summary()
     return model_object
+
+
+def create_model(option_dict, vector_loss_function, num_output_channels=1,
+                 scalar_loss_function=None):
+    """Creates U-net.
+
+    This method sets up the architecture, loss function, and optimizer -- and
+    compiles the model -- but does not train it.
+
+    Architecture taken from:
+    https://github.com/zhixuhao/unet/blob/master/model.py
+
+    :param option_dict: See doc for `_check_architecture_args`.
+    :param vector_loss_function: Loss function for vector outputs.
+    :param num_output_channels: Number of output channels.
+    :param scalar_loss_function: Loss function scalar outputs.  If there are no
+        dense layers, leave this alone.
+    :return: model_object: Instance of `keras.models.Model`, with the
+        aforementioned architecture.
+    """
+
+    # The mixed-precision option changes the global dtype policy while layers
+    # are built.  Restore the caller's policy even if the build fails, so that
+    # later models in the same process are not silently built in 16 bits.
+    orig_policy_object = keras.mixed_precision.global_policy()
+
+    try:
+        return _create_model(
+            option_dict=option_dict, vector_loss_function=vector_loss_function,
+            num_output_channels=num_output_channels,
+            scalar_loss_function=scalar_loss_function
+        )
+    finally:
+        keras.mixed_precision.set_global_policy(orig_policy_object)
@@ -0,0 +1,74 @@
+"""Unit tests for u_net_architecture.py."""
+
+import copy
+import unittest
+import numpy
+import keras
+from ml4rt.machine_learning import u_net_architecture
+
+# The following constants are used to test create_model.
+OPTION_DICT = copy.deepcopy(
+    u_net_architecture.DEFAULT_ARCHITECTURE_OPTION_DICT
+)
+OPTION_DICT[u_net_architecture.INPUT_DIMENSIONS_KEY] = numpy.array(
+    [16, 4], dtype=int
+)
+OPTION_DICT[u_net_architecture.NUM_LEVELS_KEY] = 2
+OPTION_DICT[u_net_architecture.CONV_LAYER_COUNTS_KEY] = numpy.full(
+    3, 1, dtype=int
+)
+OPTION_DICT[u_net_architecture.CHANNEL_COUNTS_KEY] = numpy.array(
+    [8, 16, 32], dtype=int
+)
+OPTION_DICT[u_net_architecture.ENCODER_DROPOUT_RATES_KEY] = numpy.full(3, 0.)
+OPTION_DICT[u_net_architecture.UPCONV_DROPOUT_RATES_KEY] = numpy.full(2, 0.)
+OPTION_DICT[u_net_architecture.SKIP_DROPOUT_RATES_KEY] = numpy.full(2, 0.)
+OPTION_DICT[u_net_architecture.USE_MIXED_PRECISION_KEY] = True
+
+ORIG_POLICY_STRING = 'mixed_bfloat16'
+
+
+class UNetArchitectureTests(unittest.TestCase):
+    """Each method is a unit test for u_net_architecture.py."""
+
+    def tearDown(self):
+        """Resets global dtype policy after each test."""
+
+        keras.mixed_precision.set_global_policy(
+            u_net_architecture.FULL_PRECISION_POLICY_STRING
+        )
+
+    def test_create_model_restores_policy(self):
+        """Ensures that create_model restores the caller's dtype policy."""
+
+        keras.mixed_precision.set_global_policy(ORIG_POLICY_STRING)
+        u_net_architecture.create_model(
+            option_dict=copy.deepcopy(OPTION_DICT),
+            vector_loss_function='mse', num_output_channels=1
+        )
+
+        self.assertTrue(
+            keras.mixed_precision.global_policy().name == ORIG_POLICY_STRING
+        )
+
+    def test_create_model_restores_policy_on_error(self):
+        """Ensures that create_model restores dtype policy if build fails.
+
+        In this case, the conv layers cannot be built with zero filters.
+        """
+
+        keras.mixed_precision.set_global_policy(ORIG_POLICY_STRING)
+
+        with self.assertRaises(ValueError):
+            u_net_architecture.create_model(
+                option_dict=copy.deepcopy(OPTION_DICT),
+                vector_loss_function='mse', num_output_channels=0
+            )
+
+        self.assertTrue(
+            keras.mixed_precision.global_policy().name == ORIG_POLICY_STRING
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -123,6 +123,19 @@ class TaylorDiagram(object):
 
         return l
 
+    def add_samples(self, stddevs, corrcoefs, *args, **kwargs):
+        """
+        Add many samples (*stddevs*, *corrcoefs*) to the Taylor
+        diagram as one collection. *args* and *kwargs* are directly
+        propagated to the `Axes.scatter` command.
+        """
+
+        c = self.ax.scatter(NP.arccos(corrcoefs), stddevs,
+                            *args, **kwargs)  # (theta, radius)
+        self.samplePoints.append(c)
+
+        return c
+
     def add_grid(self, *args, **kwargs):
         """Add a grid."""
 
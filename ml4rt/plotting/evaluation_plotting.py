@@ -3,7 +3,9 @@
 import numpy
 import matplotlib
 matplotlib.use('agg')
+import matplotlib.collections
 import matplotlib.colors
+import matplotlib.lines
 import matplotlib.patches
 from matplotlib import pyplot
 from gewittergefahr.gg_utils import error_checking
@@ -34,21 +36,30 @@ VALID_SCORE_NAMES = [
     KS_STATISTIC_NAME, KS_P_VALUE_NAME
 ]
 
-RELIABILITY_LINE_COLOUR = numpy.array([228, 26, 28], dtype=float) / 255
+RELIABILITY_LINE_COLOUR = matplotlib.colors.to_rgba(
+    numpy.array([228, 26, 28], dtype=float) / 255
+)
 RELIABILITY_LINE_WIDTH = 3.
 
-REFERENCE_LINE_COLOUR = numpy.full(3, 152. / 255)
+REFERENCE_LINE_COLOUR = matplotlib.colors.to_rgba(numpy.full(3, 152. / 255))
 REFERENCE_LINE_WIDTH = 2.
 
-CLIMO_LINE_COLOUR = numpy.full(3, 152. / 255)
+CLIMO_LINE_COLOUR = matplotlib.colors.to_rgba(numpy.full(3, 152. / 255))
 CLIMO_LINE_WIDTH = 2.
 
-ZERO_SKILL_LINE_COLOUR = numpy.array([31, 120, 180], dtype=float) / 255
+ZERO_SKILL_LINE_COLOUR = matplotlib.colors.to_rgba(
+    numpy.array([31, 120, 180], dtype=float) / 255
+)
 ZERO_SKILL_LINE_WIDTH = 2.
 POSITIVE_SKILL_AREA_OPACITY = 0.2
-
-HISTOGRAM_FACE_COLOUR = numpy.array([228, 26, 28], dtype=float) / 255
-HISTOGRAM_EDGE_COLOUR = numpy.full(3, 0.)
+POSITIVE_SKILL_AREA_COLOUR = matplotlib.colors.to_rgba(
+    ZERO_SKILL_LINE_COLOUR, POSITIVE_SKILL_AREA_OPACITY
+)
+
+HISTOGRAM_FACE_COLOUR = matplotlib.colors.to_rgba(
+    numpy.array([228, 26, 28], dtype=float) / 255
+)
+HISTOGRAM_EDGE_COLOUR = matplotlib.colors.to_rgba(numpy.full(3, 0.))
 HISTOGRAM_EDGE_WIDTH = 2.
 HISTOGRAM_FONT_SIZE = 24
 
@@ -60,13 +71,15 @@ TAYLOR_PREDICTION_MARKER_SIZE = 20
 DEFAULT_HEIGHT_CMAP_OBJECT = pyplot.get_cmap('viridis')
 
 FONT_SIZE = 36
-pyplot.rc('font', size=FONT_SIZE)
-pyplot.rc('axes', titlesize=FONT_SIZE)
-pyplot.rc('axes', labelsize=FONT_SIZE)
-pyplot.rc('xtick', labelsize=FONT_SIZE)
-pyplot.rc('ytick', labelsize=FONT_SIZE)
-pyplot.rc('legend', fontsize=FONT_SIZE)
-pyplot.rc('figure', titlesize=FONT_SIZE)
+matplotlib.rcParams.update({
+    'font.size': FONT_SIZE,
+    'axes.titlesize': FONT_SIZE,
+    'axes.labelsize': FONT_SIZE,
+    'xtick.labelsize': FONT_SIZE,
+    'ytick.labelsize': FONT_SIZE,
+    'legend.fontsize': FONT_SIZE,
+    'figure.titlesize': FONT_SIZE
+})
 
 
 def _check_score_name(score_name):
@@ -111,24 +124,22 @@ def _plot_reliability_curve(
     perfect_x_coords = numpy.array([min_value_to_plot, max_value_to_plot])
     perfect_y_coords = numpy.array([min_value_to_plot, max_value_to_plot])
 
-    axes_object.plot(
+    axes_object.add_line(matplotlib.lines.Line2D(
         perfect_x_coords, perfect_y_coords, color=REFERENCE_LINE_COLOUR,
         linestyle='dashed', linewidth=REFERENCE_LINE_WIDTH
-    )
+    ))
 
-    nan_flags = numpy.logical_or(
+    real_flags = numpy.invert(numpy.logical_or(
         numpy.isnan(mean_predictions), numpy.isnan(mean_observations)
-    )
-
-    if numpy.all(nan_flags):
-        main_line_handle = None
-    else:
-        real_indices = numpy.where(numpy.invert(nan_flags))[0]
+    ))
 
+    if numpy.any(real_flags):
         main_line_handle = axes_object.plot(
-            mean_predictions[real_indices], mean_observations[real_indices],
+            mean_predictions[real_flags], mean_observations[real_flags],
             color=line_colour, linestyle=line_style, linewidth=line_width
         )[0]
+    else:
+        main_line_handle = None
 
     axes_object.set_xlabel('Prediction')
     axes_object.set_ylabel('Conditional mean observation')
@@ -212,16 +223,12 @@ def _plot_attr_diagram_background(
         )
     )
 
-    skill_area_colour = matplotlib.colors.to_rgba(
-        ZERO_SKILL_LINE_COLOUR, POSITIVE_SKILL_AREA_OPACITY
-    )
-
     left_polygon_coord_matrix = numpy.transpose(numpy.vstack((
         x_coords_left, y_coords_left
     )))
     left_patch_object = matplotlib.patches.Polygon(
         left_polygon_coord_matrix, lw=0,
-        ec=skill_area_colour, fc=skill_area_colour
+        ec=POSITIVE_SKILL_AREA_COLOUR, fc=POSITIVE_SKILL_AREA_COLOUR
     )
     axes_object.add_patch(left_patch_object)
 
@@ -230,7 +237,7 @@ def _plot_attr_diagram_background(
     )))
     right_patch_object = matplotlib.patches.Polygon(
         right_polygon_coord_matrix, lw=0,
-        ec=skill_area_colour, fc=skill_area_colour
+        ec=POSITIVE_SKILL_AREA_COLOUR, fc=POSITIVE_SKILL_AREA_COLOUR
     )
     axes_object.add_patch(right_patch_object)
 
@@ -240,22 +247,25 @@ def _plot_attr_diagram_background(
         max_value_in_plot=max_value_in_plot
     )
 
-    axes_object.plot(
+    axes_object.add_line(matplotlib.lines.Line2D(
         no_skill_x_coords, no_skill_y_coords, color=ZERO_SKILL_LINE_COLOUR,
         linestyle='solid', linewidth=ZERO_SKILL_LINE_WIDTH
-    )
+    ))
 
-    climo_x_coords = numpy.full(2, mean_value_in_training)
-    climo_y_coords = numpy.array([min_value_in_plot, max_value_in_plot])
-    axes_object.plot(
+    # Vertical and horizontal climo lines, separated by NaN so that they can be
+    # drawn as one artist.
+    climo_x_coords = numpy.array([
+        mean_value_in_training, mean_value_in_training, numpy.nan,
+        min_value_in_plot, max_value_in_plot
+    ])
+    climo_y_coords = numpy.array([
+        min_value_in_plot, max_value_in_plot, numpy.nan,
+        mean_value_in_training, mean_value_in_training
+    ])
+    axes_object.add_line(matplotlib.lines.Line2D(
         climo_x_coords, climo_y_coords, color=CLIMO_LINE_COLOUR,
         linestyle='dashed', linewidth=CLIMO_LINE_WIDTH
-    )
-
-    axes_object.plot(
-        climo_y_coords, climo_x_coords, color=CLIMO_LINE_COLOUR,
-        linestyle='dashed', linewidth=CLIMO_LINE_WIDTH
-    )
+    ))
 
 
 def plot_inset_histogram(
@@ -288,7 +298,7 @@ def plot_inset_histogram(
         bin_counts, exact_dimensions=expected_dim
     )
 
-    bin_frequencies = bin_counts.astype(float) / numpy.sum(bin_counts)
+    bin_frequencies = bin_counts / float(max([numpy.sum(bin_counts), 1]))
 
     if has_predictions:
         inset_axes_object = figure_object.add_axes([0.675, 0.2, 0.2, 0.2])
@@ -323,14 +333,10 @@ def plot_inset_histogram(
     x_tick_values = fake_bin_centers[tick_indices]
     x_tick_labels = ['{0:.1f}'.format(b) for b in bin_centers[tick_indices]]
     inset_axes_object.set_xticks(x_tick_values)
-    inset_axes_object.set_xticklabels(x_tick_labels)
-
-    for this_tick_object in inset_axes_object.xaxis.get_major_ticks():
-        this_tick_object.label.set_fontsize(HISTOGRAM_FONT_SIZE)
-        this_tick_object.label.set_rotation('vertical')
-
-    for this_tick_object in inset_axes_object.yaxis.get_major_ticks():
-        this_tick_object.label.set_fontsize(HISTOGRAM_FONT_SIZE)
+    inset_axes_object.set_xticklabels(
+        x_tick_labels, rotation='vertical', fontsize=HISTOGRAM_FONT_SIZE
+    )
+    inset_axes_object.tick_params(axis='y', labelsize=HISTOGRAM_FONT_SIZE)
 
     inset_axes_object.set_title(
         'Prediction frequency' if has_predictions else 'Observation frequency',
@@ -555,10 +561,10 @@ def plot_score_profile(
         reference_x_coords = numpy.full(2, 0.)
         reference_y_coords = numpy.array([0, max_height_km_agl], dtype=float)
 
-        axes_object.plot(
+        axes_object.add_line(matplotlib.lines.Line2D(
             reference_x_coords, reference_y_coords, color=REFERENCE_LINE_COLOUR,
             linestyle='dashed', linewidth=REFERENCE_LINE_WIDTH
-        )
+        ))
 
     finite_indices = numpy.where(numpy.isfinite(score_values))[0]
 
@@ -594,11 +600,17 @@ def plot_score_profile(
     else:
         axes_object.set_ylim(0, max_height_km_agl)
 
+    y_tick_values_km_agl = axes_object.get_yticks()
     y_tick_strings = profile_plotting.create_height_labels(
-        tick_values_km_agl=axes_object.get_yticks(),
-        use_log_scale=use_log_scale
+        tick_values_km_agl=y_tick_values_km_agl, use_log_scale=use_log_scale
     )
+    y_limits_km_agl = axes_object.get_ylim()
+    axes_object.set_yticks(y_tick_values_km_agl)
     axes_object.set_yticklabels(y_tick_strings)
+
+    # get_yticks also returns ticks outside the visible range, and set_yticks
+    # widens the axis to include them.  Restore the original limits.
+    axes_object.set_ylim(y_limits_km_agl)
     axes_object.set_ylabel('Height (km AGL)')
 
     return main_line_handle
@@ -741,20 +753,36 @@ def plot_rel_curve_many_heights(
     colour_norm_object = matplotlib.colors.LogNorm(
         vmin=numpy.min(heights_km_agl), vmax=numpy.max(heights_km_agl)
     )
+    colour_matrix = colour_map_object(colour_norm_object(heights_km_agl))
 
-    for j in range(num_heights):
-        this_colour = colour_map_object(colour_norm_object(
-            heights_km_agl[j]
-        ))
+    perfect_coords = numpy.array([min_value_to_plot, max_value_to_plot])
+    axes_object.add_line(matplotlib.lines.Line2D(
+        perfect_coords, perfect_coords, color=REFERENCE_LINE_COLOUR,
+        linestyle='dashed', linewidth=REFERENCE_LINE_WIDTH
+    ))
 
-        _plot_reliability_curve(
-            axes_object=axes_object,
-            mean_predictions=mean_prediction_matrix[j, :],
-            mean_observations=mean_target_matrix[j, :],
-            line_colour=this_colour, min_value_to_plot=min_value_to_plot,
-            max_value_to_plot=max_value_to_plot
-        )
+    real_flag_matrix = numpy.invert(numpy.logical_or(
+        numpy.isnan(mean_prediction_matrix), numpy.isnan(mean_target_matrix)
+    ))
+    good_height_indices = numpy.where(numpy.any(real_flag_matrix, axis=1))[0]
 
+    # Plot all reliability curves as one artist, rather than one per height.
+    curve_coord_matrices = [
+        numpy.transpose(numpy.vstack((
+            mean_prediction_matrix[j, real_flag_matrix[j, :]],
+            mean_target_matrix[j, real_flag_matrix[j, :]]
+        )))
+        for j in good_height_indices
+    ]
+
+    line_collection_object = matplotlib.collections.LineCollection(
+        curve_coord_matrices, colors=colour_matrix[good_height_indices, :],
+        linestyles='solid', linewidths=RELIABILITY_LINE_WIDTH
+    )
+    axes_object.add_collection(line_collection_object)
+
+    axes_object.set_xlabel('Prediction')
+    axes_object.set_ylabel('Conditional mean observation')
     axes_object.set_xlim(min_value_to_plot, max_value_to_plot)
     axes_object.set_ylim(min_value_to_plot, max_value_to_plot)
 
@@ -828,6 +856,8 @@ def plot_taylor_diagram_many_heights(
         vmin=numpy.min(heights_km_agl), vmax=numpy.max(heights_km_agl)
     )
 
+    colour_matrix = colour_map_object(colour_norm_object(heights_km_agl))
+
     mean_target_stdev = numpy.mean(target_stdevs)
     this_ratio = numpy.maximum(
         numpy.max(target_stdevs), numpy.max(prediction_stdevs)
@@ -841,31 +871,24 @@ def plot_taylor_diagram_many_heights(
     this_marker_object = taylor_diagram_object.samplePoints[0]
     this_marker_object.set_visible(False)
 
-    for j in range(num_heights):
-        if numpy.isnan(correlations[j]):
-            continue
-
-        this_colour = colour_map_object(colour_norm_object(
-            heights_km_agl[j]
-        ))
-
-        taylor_diagram_object.add_sample(stddev=target_stdevs[j], corrcoef=1.)
+    # Add all target points as one collection, then all prediction points as
+    # another.  Marker area for `scatter` is the square of marker size.
+    real_indices = numpy.where(numpy.invert(numpy.isnan(correlations)))[0]
 
-        this_marker_object = taylor_diagram_object.samplePoints[-1]
-        this_marker_object.set_marker(TAYLOR_TARGET_MARKER_TYPE)
-        this_marker_object.set_markersize(TAYLOR_TARGET_MARKER_SIZE)
-        this_marker_object.set_markerfacecolor(this_colour)
-        this_marker_object.set_markeredgewidth(0)
-
-        taylor_diagram_object.add_sample(
-            stddev=prediction_stdevs[j], corrcoef=correlations[j]
-        )
+    taylor_diagram_object.add_samples(
+        stddevs=target_stdevs[real_indices],
+        corrcoefs=numpy.full(len(real_indices), 1.),
+        marker=TAYLOR_TARGET_MARKER_TYPE, s=TAYLOR_TARGET_MARKER_SIZE ** 2,
+        c=colour_matrix[real_indices, :], linewidths=0
+    )
 
-        this_marker_object = taylor_diagram_object.samplePoints[-1]
-        this_marker_object.set_marker(TAYLOR_PREDICTION_MARKER_TYPE)
-        this_marker_object.set_markersize(TAYLOR_PREDICTION_MARKER_SIZE)
-        this_marker_object.set_markerfacecolor(this_colour)
-        this_marker_object.set_markeredgewidth(0)
+    taylor_diagram_object.add_samples(
+        stddevs=prediction_stdevs[real_indices],
+        corrcoefs=correlations[real_indices],
+        marker=TAYLOR_PREDICTION_MARKER_TYPE,
+        s=TAYLOR_PREDICTION_MARKER_SIZE ** 2,
+        c=colour_matrix[real_indices, :], linewidths=0
+    )
 
     crmse_contour_object = taylor_diagram_object.add_contours(
         levels=5, colors='0.5'
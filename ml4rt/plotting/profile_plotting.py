@@ -309,6 +309,25 @@ def plot_predictors(
     }
 
 
+def clear_predictors(handle_dict):
+    """Removes plotted predictors from figure, keeping the axes.
+
+    This allows one figure, created by `plot_predictors`, to be reused for many
+    examples with the same number of predictors.  Figure creation is expensive,
+    so reusing is much faster than creating a new figure for each example.
+
+    :param handle_dict: Dictionary returned by `plot_predictors`.
+    """
+
+    for this_axes_object in handle_dict[AXES_OBJECTS_KEY]:
+        for this_artist in (
+                list(this_axes_object.lines) + list(this_axes_object.texts)
+        ):
+            this_artist.remove()
+
+        this_axes_object.relim()
+
+
 def plot_targets(
         example_dict, example_index, use_log_scale,
         line_width=DEFAULT_LINE_WIDTH, line_style='solid', handle_dict=None):
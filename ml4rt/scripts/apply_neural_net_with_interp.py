@@ -1,11 +1,11 @@
 """Applies trained neural net and interpolates heating rates to new grid."""
 
 import os
-import copy
 import argparse
 import numpy
 from gewittergefahr.gg_utils import time_conversion
 from gewittergefahr.gg_utils import longitude_conversion as lng_conversion
+from gewittergefahr.gg_utils import error_checking
 from ml4rt.io import example_io
 from ml4rt.io import prediction_io
 from ml4rt.utils import example_utils
@@ -31,6 +31,7 @@ NEW_GRID_NORM_FILE_ARG_NAME = 'input_new_grid_norm_file_name'
 HALF_WINDOW_SIZE_ARG_NAME = 'half_window_size_for_interp_px'
 FIRST_TIME_ARG_NAME = 'first_time_string'
 LAST_TIME_ARG_NAME = 'last_time_string'
+NUM_EXAMPLES_PER_BATCH_ARG_NAME = 'num_examples_per_batch'
 OUTPUT_FILE_ARG_NAME = 'output_file_name'
 
 MODEL_FILE_HELP_STRING = (
@@ -52,12 +53,19 @@ HALF_WINDOW_SIZE_HELP_STRING = (
     'Half-window size (pixels) for maximum filter used during interpolation.'
 )
 TIME_HELP_STRING = (
-    'Time (format "yyyy-mm-dd-HHMMSS").  The neural net will be applied only to'
-    ' examples from `{0:s}` to `{1:s}`.'
+    'List of times (format "yyyy-mm-dd-HHMMSS").  The neural net will be '
+    'applied to examples from the [i]th entry of `{0:s}` to the [i]th entry of '
+    '`{1:s}`, for each i.  The model is read only once, so passing many '
+    'periods here is faster than calling this script once per period.'
 ).format(FIRST_TIME_ARG_NAME, LAST_TIME_ARG_NAME)
 
+NUM_EXAMPLES_PER_BATCH_HELP_STRING = (
+    'Number of examples per batch when applying the neural net.  Larger '
+    'batches use the GPU more efficiently but need more memory.'
+)
 OUTPUT_FILE_HELP_STRING = (
-    'Path to output file (will be written by `prediction_io.write_file`).'
+    'List of paths to output files (will be written by '
+    '`prediction_io.write_file`), one per time period.'
 )
 
 INPUT_ARG_PARSER = argparse.ArgumentParser()
@@ -82,13 +90,19 @@ INPUT_ARG_PARSER.add_argument(
     help=HALF_WINDOW_SIZE_HELP_STRING
 )
 INPUT_ARG_PARSER.add_argument(
-    '--' + FIRST_TIME_ARG_NAME, type=str, required=True, help=TIME_HELP_STRING
+    '--' + FIRST_TIME_ARG_NAME, type=str, nargs='+', required=True,
+    help=TIME_HELP_STRING
+)
+INPUT_ARG_PARSER.add_argument(
+    '--' + LAST_TIME_ARG_NAME, type=str, nargs='+', required=True,
+    help=TIME_HELP_STRING
 )
 INPUT_ARG_PARSER.add_argument(
-    '--' + LAST_TIME_ARG_NAME, type=str, required=True, help=TIME_HELP_STRING
+    '--' + NUM_EXAMPLES_PER_BATCH_ARG_NAME, type=int, required=False,
+    default=NUM_EXAMPLES_PER_BATCH, help=NUM_EXAMPLES_PER_BATCH_HELP_STRING
 )
 INPUT_ARG_PARSER.add_argument(
-    '--' + OUTPUT_FILE_ARG_NAME, type=str, required=True,
+    '--' + OUTPUT_FILE_ARG_NAME, type=str, nargs='+', required=True,
     help=OUTPUT_FILE_HELP_STRING
 )
 
@@ -96,7 +110,7 @@ INPUT_ARG_PARSER.add_argument(
 def _get_predictions_and_targets(
         model_object, model_metadata_dict, orig_grid_example_dir_name,
         new_grid_example_dir_name, new_grid_norm_file_name, first_time_unix_sec,
-        last_time_unix_sec):
+        last_time_unix_sec, num_examples_per_batch):
     """Returns predicted and target values on both grids.
 
     :param model_object: Trained neural net (instance of `keras.models.Model` or
@@ -108,6 +122,7 @@ def _get_predictions_and_targets(
     :param new_grid_norm_file_name: Same.
     :param first_time_unix_sec: Same.
     :param last_time_unix_sec: Same.
+    :param num_examples_per_batch: Same.
     :return: orig_grid_prediction_example_dict: Dictionary with predictions on
         original grid, in format specified by `example_io.read_file`.
     :return: new_grid_target_example_dict: Dictionary with target values on new
@@ -121,7 +136,7 @@ def _get_predictions_and_targets(
     new_grid_norm_example_dict = example_io.read_file(new_grid_norm_file_name)
 
     net_type_string = model_metadata_dict[neural_net.NET_TYPE_KEY]
-    d = copy.deepcopy(model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY])
+    d = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY].copy()
 
     d[neural_net.EXAMPLE_DIRECTORY_KEY] = orig_grid_example_dir_name
     d[neural_net.FIRST_TIME_KEY] = first_time_unix_sec
@@ -141,6 +156,12 @@ def _get_predictions_and_targets(
     )
     d[neural_net.NORMALIZATION_FILE_KEY] = new_grid_norm_file_name
 
+    # Only targets are needed on the new grid, so do not read or normalize
+    # predictors.
+    d[neural_net.SCALAR_PREDICTOR_NAMES_KEY] = []
+    d[neural_net.VECTOR_PREDICTOR_NAMES_KEY] = []
+    d[neural_net.PREDICTOR_NORM_TYPE_KEY] = None
+
     _, new_grid_target_array, new_grid_id_strings = neural_net.create_data(
         option_dict=d, for_inference=True,
         net_type_string=net_type_string, exclude_summit_greenland=True
@@ -208,18 +229,20 @@ def _get_predictions_and_targets(
     del new_grid_id_strings
     print(SEPARATOR_STRING)
 
-    these_indices = numpy.where(desired_indices >= 0)[0]
-    desired_indices = desired_indices[these_indices]
+    found_flags = desired_indices >= 0
+    desired_indices = desired_indices[found_flags]
     new_grid_target_array = [
-        a[these_indices, ...] for a in new_grid_target_array
+        a[found_flags, ...] for a in new_grid_target_array
     ]
 
     predictor_matrix = predictor_matrix[desired_indices, ...]
-    example_id_strings = [example_id_strings[k] for k in desired_indices]
+    example_id_strings = (
+        numpy.array(example_id_strings)[desired_indices].tolist()
+    )
 
     orig_prediction_array = neural_net.apply_model(
         model_object=model_object, predictor_matrix=predictor_matrix,
-        num_examples_per_batch=NUM_EXAMPLES_PER_BATCH,
+        num_examples_per_batch=num_examples_per_batch,
         net_type_string=net_type_string, verbose=True
     )
 
@@ -233,8 +256,9 @@ def _get_predictions_and_targets(
         scalar_target_matrix = None
         scalar_prediction_matrix = None
 
-    new_grid_metadata_dict = copy.deepcopy(model_metadata_dict)
-    d = new_grid_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
+    # Shallow copies are enough here, since only top-level values are replaced.
+    new_grid_metadata_dict = model_metadata_dict.copy()
+    d = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY].copy()
     d[neural_net.HEIGHTS_KEY] = (
         new_grid_norm_example_dict[example_utils.HEIGHTS_KEY]
     )
@@ -296,10 +320,10 @@ def _denorm_predictions(
     this_dict = {
         example_utils.VECTOR_PREDICTOR_NAMES_KEY: [],
         example_utils.VECTOR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, num_heights, 0), 0.),
+            numpy.empty((num_examples, num_heights, 0)),
         example_utils.SCALAR_PREDICTOR_NAMES_KEY: [],
         example_utils.SCALAR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, 0), 0.)
+            numpy.empty((num_examples, 0))
     }
     prediction_example_dict.update(this_dict)
 
@@ -312,10 +336,10 @@ def _denorm_predictions(
     this_dict = {
         example_utils.VECTOR_PREDICTOR_NAMES_KEY: [],
         example_utils.VECTOR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, num_heights, 0), 0.),
+            numpy.empty((num_examples, num_heights, 0)),
         example_utils.SCALAR_PREDICTOR_NAMES_KEY: [],
         example_utils.SCALAR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, 0), 0.)
+            numpy.empty((num_examples, 0))
     }
     target_example_dict.update(this_dict)
 
@@ -346,48 +370,28 @@ def _denorm_predictions(
     return prediction_example_dict, target_example_dict
 
 
-def _run(model_file_name, orig_grid_example_dir_name, new_grid_example_dir_name,
-         new_grid_norm_file_name, half_window_size_for_interp_px,
-         first_time_string, last_time_string, output_file_name):
-    """Applies trained neural net and interpolates heating rates to new grid.
-
-    This is effectively the main method.
+def _apply_one_period(
+        model_object, model_metadata_dict, model_file_name,
+        orig_grid_example_dir_name, new_grid_example_dir_name,
+        new_grid_norm_file_name, half_window_size_for_interp_px,
+        first_time_unix_sec, last_time_unix_sec, num_examples_per_batch,
+        output_file_name):
+    """Applies trained neural net to one time period.
 
+    :param model_object: See doc for `_get_predictions_and_targets`.
+    :param model_metadata_dict: Same.
     :param model_file_name: See documentation at top of file.
     :param orig_grid_example_dir_name: Same.
     :param new_grid_example_dir_name: Same.
     :param new_grid_norm_file_name: Same.
     :param half_window_size_for_interp_px: Same.
-    :param first_time_string: Same.
-    :param last_time_string: Same.
-    :param output_file_name: Same.
+    :param first_time_unix_sec: First time in period.
+    :param last_time_unix_sec: Last time in period.
+    :param num_examples_per_batch: See documentation at top of file.
+    :param output_file_name: Path to output file for this period.
     """
 
-    first_time_unix_sec = time_conversion.string_to_unix_sec(
-        first_time_string, TIME_FORMAT
-    )
-    last_time_unix_sec = time_conversion.string_to_unix_sec(
-        last_time_string, TIME_FORMAT
-    )
-
-    print('Reading model from: "{0:s}"...'.format(model_file_name))
-    model_object = neural_net.read_model(model_file_name)
-    metafile_name = neural_net.find_metafile(
-        model_dir_name=os.path.split(model_file_name)[0],
-        raise_error_if_missing=True
-    )
-
-    print('Reading metadata from: "{0:s}"...'.format(metafile_name))
-    model_metadata_dict = neural_net.read_metafile(metafile_name)
-
     generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
-    assert not generator_option_dict[neural_net.OMIT_HEATING_RATE_KEY]
-    assert (
-        generator_option_dict[neural_net.VECTOR_TARGET_NAMES_KEY] ==
-        [example_utils.SHORTWAVE_HEATING_RATE_NAME]
-    )
-
-    print(SEPARATOR_STRING)
 
     (
         orig_grid_prediction_example_dict,
@@ -399,7 +403,8 @@ def _run(model_file_name, orig_grid_example_dir_name, new_grid_example_dir_name,
         new_grid_example_dir_name=new_grid_example_dir_name,
         new_grid_norm_file_name=new_grid_norm_file_name,
         first_time_unix_sec=first_time_unix_sec,
-        last_time_unix_sec=last_time_unix_sec
+        last_time_unix_sec=last_time_unix_sec,
+        num_examples_per_batch=num_examples_per_batch
     )
     print(SEPARATOR_STRING)
 
@@ -413,12 +418,9 @@ def _run(model_file_name, orig_grid_example_dir_name, new_grid_example_dir_name,
 
     # Zero out predicted heating rates above certain height.
     orig_heights_m_agl = generator_option_dict[neural_net.HEIGHTS_KEY] + 0.
-    these_indices = numpy.where(
-        orig_heights_m_agl >= ZERO_HEATING_HEIGHT_M_AGL
-    )[0]
-    orig_grid_prediction_example_dict[
-        example_utils.VECTOR_TARGET_VALS_KEY
-    ][..., 0][..., these_indices] = 0.
+    orig_grid_prediction_example_dict[example_utils.VECTOR_TARGET_VALS_KEY][
+        :, orig_heights_m_agl >= ZERO_HEATING_HEIGHT_M_AGL, 0
+    ] = 0.
 
     # Remove predictions above certain height.
     orig_heights_m_agl = (
@@ -470,6 +472,82 @@ def _run(model_file_name, orig_grid_example_dir_name, new_grid_example_dir_name,
     )
 
 
+def _run(model_file_name, orig_grid_example_dir_name, new_grid_example_dir_name,
+         new_grid_norm_file_name, half_window_size_for_interp_px,
+         first_time_strings, last_time_strings, num_examples_per_batch,
+         output_file_names):
+    """Applies trained neural net and interpolates heating rates to new grid.
+
+    This is effectively the main method.
+
+    :param model_file_name: See documentation at top of file.
+    :param orig_grid_example_dir_name: Same.
+    :param new_grid_example_dir_name: Same.
+    :param new_grid_norm_file_name: Same.
+    :param half_window_size_for_interp_px: Same.
+    :param first_time_strings: Same.
+    :param last_time_strings: Same.
+    :param num_examples_per_batch: Same.
+    :param output_file_names: Same.
+    """
+
+    num_periods = len(first_time_strings)
+    expected_dim = numpy.array([num_periods], dtype=int)
+    error_checking.assert_is_numpy_array(
+        numpy.array(last_time_strings), exact_dimensions=expected_dim
+    )
+    error_checking.assert_is_numpy_array(
+        numpy.array(output_file_names), exact_dimensions=expected_dim
+    )
+
+    first_times_unix_sec = numpy.array([
+        time_conversion.string_to_unix_sec(t, TIME_FORMAT)
+        for t in first_time_strings
+    ], dtype=int)
+    last_times_unix_sec = numpy.array([
+        time_conversion.string_to_unix_sec(t, TIME_FORMAT)
+        for t in last_time_strings
+    ], dtype=int)
+
+    print('Reading model from: "{0:s}"...'.format(model_file_name))
+    model_object = neural_net.read_model(model_file_name)
+    metafile_name = neural_net.find_metafile(
+        model_dir_name=os.path.split(model_file_name)[0],
+        raise_error_if_missing=True
+    )
+
+    print('Reading metadata from: "{0:s}"...'.format(metafile_name))
+    model_metadata_dict = neural_net.read_metafile(metafile_name)
+
+    generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
+    assert not generator_option_dict[neural_net.OMIT_HEATING_RATE_KEY]
+    assert (
+        generator_option_dict[neural_net.VECTOR_TARGET_NAMES_KEY] ==
+        [example_utils.SHORTWAVE_HEATING_RATE_NAME]
+    )
+
+    print(SEPARATOR_STRING)
+
+    # The model is read only once, then applied to each time period.
+    for i in range(num_periods):
+        _apply_one_period(
+            model_object=model_object,
+            model_metadata_dict=model_metadata_dict,
+            model_file_name=model_file_name,
+            orig_grid_example_dir_name=orig_grid_example_dir_name,
+            new_grid_example_dir_name=new_grid_example_dir_name,
+            new_grid_norm_file_name=new_grid_norm_file_name,
+            half_window_size_for_interp_px=half_window_size_for_interp_px,
+            first_time_unix_sec=first_times_unix_sec[i],
+            last_time_unix_sec=last_times_unix_sec[i],
+            num_examples_per_batch=num_examples_per_batch,
+            output_file_name=output_file_names[i]
+        )
+
+        if i != num_periods - 1:
+            print(SEPARATOR_STRING)
+
+
 if __name__ == '__main__':
     INPUT_ARG_OBJECT = INPUT_ARG_PARSER.parse_args()
 
@@ -487,7 +565,10 @@ if __name__ == '__main__':
         half_window_size_for_interp_px=getattr(
             INPUT_ARG_OBJECT, HALF_WINDOW_SIZE_ARG_NAME
         ),
-        first_time_string=getattr(INPUT_ARG_OBJECT, FIRST_TIME_ARG_NAME),
-        last_time_string=getattr(INPUT_ARG_OBJECT, LAST_TIME_ARG_NAME),
-        output_file_name=getattr(INPUT_ARG_OBJECT, OUTPUT_FILE_ARG_NAME)
+        first_time_strings=getattr(INPUT_ARG_OBJECT, FIRST_TIME_ARG_NAME),
+        last_time_strings=getattr(INPUT_ARG_OBJECT, LAST_TIME_ARG_NAME),
+        num_examples_per_batch=getattr(
+            INPUT_ARG_OBJECT, NUM_EXAMPLES_PER_BATCH_ARG_NAME
+        ),
+        output_file_names=getattr(INPUT_ARG_OBJECT, OUTPUT_FILE_ARG_NAME)
     )
@@ -383,8 +383,9 @@ def _plot_attributes_diagram(
         for a in mean_predictions_by_set + mean_observations_by_set
         if a is not None
     ])
-    max_value_to_plot = numpy.nanpercentile(concat_values, 99.9)
-    min_value_to_plot = numpy.nanpercentile(concat_values, 0.1)
+    min_value_to_plot, max_value_to_plot = numpy.nanpercentile(
+        concat_values, [0.1, 99.9]
+    )
     min_value_to_plot = numpy.minimum(min_value_to_plot, 0.)
 
     num_evaluation_sets = len(evaluation_tables_xarray)
@@ -7,6 +7,7 @@ import matplotlib
 matplotlib.use('agg')
 from matplotlib import pyplot
 from gewittergefahr.gg_utils import file_system_utils
+from gewittergefahr.gg_utils import error_checking
 from ml4rt.io import prediction_io
 from ml4rt.utils import example_utils
 from ml4rt.machine_learning import saliency
@@ -114,6 +115,8 @@ pyplot.rc('figure', titlesize=DEFAULT_FONT_SIZE)
 SALIENCY_FILE_ARG_NAME = 'input_saliency_file_name'
 USE_LOG_SCALE_ARG_NAME = 'use_log_scale'
 PREDICTION_FILE_ARG_NAME = 'input_prediction_file_name'
+FIRST_EXAMPLE_ARG_NAME = 'first_example_index'
+NUM_EXAMPLES_ARG_NAME = 'num_examples_to_plot'
 OUTPUT_DIR_ARG_NAME = 'output_dir_name'
 
 SALIENCY_FILE_HELP_STRING = (
@@ -130,6 +133,17 @@ PREDICTION_FILE_HELP_STRING = (
     'legend of the saliency plot.  If saliency file contains values for '
     'non-output neuron, this file is not needed.'
 )
+FIRST_EXAMPLE_HELP_STRING = (
+    'Array index of first example to plot.  Together with `{0:s}`, this lets '
+    'you split the saliency file among several copies of this script, run in '
+    'parallel.'
+).format(NUM_EXAMPLES_ARG_NAME)
+
+NUM_EXAMPLES_HELP_STRING = (
+    'Number of examples to plot, starting at `{0:s}`.  If you want to plot all '
+    'remaining examples, leave this alone.'
+).format(FIRST_EXAMPLE_ARG_NAME)
+
 OUTPUT_DIR_HELP_STRING = (
     'Name of output directory (figures will be saved here).'
 )
@@ -147,6 +161,14 @@ INPUT_ARG_PARSER.add_argument(
     '--' + PREDICTION_FILE_ARG_NAME, type=str, required=False, default='',
     help=PREDICTION_FILE_HELP_STRING
 )
+INPUT_ARG_PARSER.add_argument(
+    '--' + FIRST_EXAMPLE_ARG_NAME, type=int, required=False, default=0,
+    help=FIRST_EXAMPLE_HELP_STRING
+)
+INPUT_ARG_PARSER.add_argument(
+    '--' + NUM_EXAMPLES_ARG_NAME, type=int, required=False, default=-1,
+    help=NUM_EXAMPLES_HELP_STRING
+)
 INPUT_ARG_PARSER.add_argument(
     '--' + OUTPUT_DIR_ARG_NAME, type=str, required=True,
     help=OUTPUT_DIR_HELP_STRING
@@ -172,18 +194,6 @@ def _get_target_values(
     :return: actual_values: length-E numpy array of actual target values.
     """
 
-    print((
-        'Reading predicted and actual target values from: "{0:s}"...'
-    ).format(
-        prediction_file_name
-    ))
-    prediction_dict = prediction_io.read_file(prediction_file_name)
-
-    example_indices = numpy.array([
-        prediction_dict[prediction_io.EXAMPLE_IDS_KEY].index(id)
-        for id in example_id_strings
-    ], dtype=int)
-
     generator_option_dict = (
         model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
     )
@@ -193,53 +203,95 @@ def _get_target_values(
             generator_option_dict[neural_net.SCALAR_TARGET_NAMES_KEY]
         )
         channel_index = scalar_target_names.index(target_field_name)
-
-        actual_values = (
-            prediction_dict[prediction_io.SCALAR_TARGETS_KEY][
-                example_indices, channel_index
-            ]
+        height_index = None
+    else:
+        vector_target_names = (
+            generator_option_dict[neural_net.VECTOR_TARGET_NAMES_KEY]
         )
-        predicted_values = (
-            prediction_dict[prediction_io.SCALAR_PREDICTIONS_KEY][
-                example_indices, channel_index
-            ]
+        channel_index = vector_target_names.index(target_field_name)
+        height_index = example_utils.match_heights(
+            heights_m_agl=generator_option_dict[neural_net.HEIGHTS_KEY],
+            desired_height_m_agl=target_height_m_agl
         )
 
-        return predicted_values, actual_values
-
-    vector_target_names = (
-        generator_option_dict[neural_net.VECTOR_TARGET_NAMES_KEY]
+    print((
+        'Reading predicted and actual target values from: "{0:s}"...'
+    ).format(
+        prediction_file_name
+    ))
+    all_predicted_values, all_actual_values, all_id_strings = (
+        prediction_io.read_one_target_field(
+            netcdf_file_name=prediction_file_name,
+            channel_index=channel_index, height_index=height_index
+        )
     )
-    channel_index = vector_target_names.index(target_field_name)
 
-    height_index = example_utils.match_heights(
-        heights_m_agl=generator_option_dict[neural_net.HEIGHTS_KEY],
-        desired_height_m_agl=target_height_m_agl
+    id_string_to_index = dict()
+    for j, this_id_string in enumerate(all_id_strings):
+        id_string_to_index[this_id_string] = j
+
+    example_indices = numpy.array(
+        [id_string_to_index[s] for s in example_id_strings], dtype=int
     )
 
-    actual_values = (
-        prediction_dict[prediction_io.VECTOR_TARGETS_KEY][
-            example_indices, height_index, channel_index
-        ]
+    predicted_values = numpy.take(all_predicted_values, example_indices)
+    actual_values = numpy.take(all_actual_values, example_indices)
+
+    return predicted_values, actual_values
+
+
+def _find_predictors_by_set(model_metadata_dict):
+    """Finds which predictors in each set were used by the model.
+
+    :param model_metadata_dict: Dictionary returned by
+        `neural_net.read_metafile`.
+    :return: vector_indices_by_set: 1-D list, where the [k]th item is a numpy
+        array of indices into `VECTOR_PREDICTOR_NAMES_BY_SET[k]`, indicating
+        which predictors in the [k]th set were used.
+    :return: scalar_indices_by_set: Same but for scalar predictors.
+    """
+
+    generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
+    vector_predictor_names = set(
+        generator_option_dict[neural_net.VECTOR_PREDICTOR_NAMES_KEY]
     )
-    predicted_values = (
-        prediction_dict[prediction_io.VECTOR_PREDICTIONS_KEY][
-            example_indices, height_index, channel_index
-        ]
+    scalar_predictor_names = set(
+        generator_option_dict[neural_net.SCALAR_PREDICTOR_NAMES_KEY]
     )
 
-    return predicted_values, actual_values
+    vector_indices_by_set = [
+        numpy.where(numpy.array(
+            [n in vector_predictor_names for n in these_names], dtype=bool
+        ))[0]
+        for these_names in VECTOR_PREDICTOR_NAMES_BY_SET
+    ]
+    scalar_indices_by_set = [
+        numpy.where(numpy.array(
+            [n in scalar_predictor_names for n in these_names], dtype=bool
+        ))[0]
+        for these_names in SCALAR_PREDICTOR_NAMES_BY_SET
+    ]
+
+    return vector_indices_by_set, scalar_indices_by_set
 
 
 def _plot_saliency_one_example(
-        saliency_dict, example_index, model_metadata_dict, use_log_scale,
-        legend_suffix, output_dir_name):
+        saliency_dict, example_index, model_metadata_dict,
+        vector_indices_by_set, scalar_indices_by_set,
+        handle_dict_by_num_predictors, use_log_scale, legend_suffix,
+        output_dir_name):
     """Plots saliency map for one example.
 
     :param saliency_dict: Dictionary read by `saliency.read_file`.
     :param example_index: Will plot saliency map for example with this array
         index.
     :param model_metadata_dict: Dictionary read by `neural_net.read_metafile`.
+    :param vector_indices_by_set: See output doc for `_find_predictors_by_set`.
+    :param scalar_indices_by_set: Same.
+    :param handle_dict_by_num_predictors: Dictionary, where each key is a number
+        of predictors and each value is a figure to be reused (in the format
+        returned by `profile_plotting.plot_predictors`).  This dictionary will
+        be updated in place.
     :param use_log_scale: See documentation at top of file.
     :param legend_suffix: End of figure legend.
     :param output_dir_name: Name of output directory.  Figure will be saved
@@ -248,6 +300,7 @@ def _plot_saliency_one_example(
 
     # Housekeeping.
     example_id_string = saliency_dict[saliency.EXAMPLE_IDS_KEY][example_index]
+    file_name_id_string = example_id_string.replace('_', '-')
     generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
 
     example_dict = {
@@ -287,37 +340,58 @@ def _plot_saliency_one_example(
     else:
         legend_string = legend_suffix
 
-    num_predictor_sets = len(VECTOR_PREDICTOR_NAMES_BY_SET)
+    # Vector-predictor sets are always plotted (with legend), scalar-predictor
+    # sets only if scalar saliency is a function of height (without legend).
+    predictor_names_by_set = list(VECTOR_PREDICTOR_NAMES_BY_SET)
+    predictor_colours_by_set = list(VECTOR_PREDICTOR_COLOURS_BY_SET)
+    indices_by_set = list(vector_indices_by_set)
+    file_labels = [
+        'vector-predictor-set-{0:d}'.format(k)
+        for k in range(len(VECTOR_PREDICTOR_NAMES_BY_SET))
+    ]
+    add_legend_flags = [True] * len(VECTOR_PREDICTOR_NAMES_BY_SET)
+
+    if num_scalar_dim != 1:
+        predictor_names_by_set += SCALAR_PREDICTOR_NAMES_BY_SET
+        predictor_colours_by_set += SCALAR_PREDICTOR_COLOURS_BY_SET
+        indices_by_set += scalar_indices_by_set
+        file_labels += [
+            'scalar-predictor-set-{0:d}'.format(k)
+            for k in range(len(SCALAR_PREDICTOR_NAMES_BY_SET))
+        ]
+        add_legend_flags += [False] * len(SCALAR_PREDICTOR_NAMES_BY_SET)
 
-    for k in range(num_predictor_sets):
-        these_flags = numpy.array([
-            n in example_dict[example_utils.VECTOR_PREDICTOR_NAMES_KEY]
-            for n in VECTOR_PREDICTOR_NAMES_BY_SET[k]
-        ], dtype=bool)
+    num_predictor_sets = len(predictor_names_by_set)
 
-        these_indices = numpy.where(these_flags)[0]
+    for k in range(num_predictor_sets):
+        these_indices = indices_by_set[k]
         if len(these_indices) == 0:
             continue
 
-        predictor_names = [
-            VECTOR_PREDICTOR_NAMES_BY_SET[k][i] for i in these_indices
-        ]
+        predictor_names = [predictor_names_by_set[k][i] for i in these_indices]
         predictor_colours = [
-            VECTOR_PREDICTOR_COLOURS_BY_SET[k][i] for i in these_indices
+            predictor_colours_by_set[k][i] for i in these_indices
         ]
 
+        num_predictors = len(these_indices)
+        handle_dict = handle_dict_by_num_predictors.get(num_predictors, None)
+        if handle_dict is not None:
+            profile_plotting.clear_predictors(handle_dict)
+
         handle_dict = profile_plotting.plot_predictors(
             example_dict=example_dict, example_index=0,
             predictor_names=predictor_names,
             predictor_colours=predictor_colours,
-            predictor_line_widths=numpy.full(len(these_indices), 2),
-            predictor_line_styles=['solid'] * len(these_indices),
-            use_log_scale=use_log_scale, include_units=False, handle_dict=None
+            predictor_line_widths=numpy.full(num_predictors, 2),
+            predictor_line_styles=['solid'] * num_predictors,
+            use_log_scale=use_log_scale, include_units=False,
+            handle_dict=handle_dict
         )
+        handle_dict_by_num_predictors[num_predictors] = handle_dict
 
         axes_object = handle_dict[profile_plotting.AXES_OBJECTS_KEY][0]
 
-        if legend_string != '':
+        if add_legend_flags[k] and legend_string != '':
             axes_object.text(
                 0.01, 0.99, legend_string, fontsize=LEGEND_FONT_SIZE, color='k',
                 bbox=LEGEND_BOUNDING_BOX_DICT, horizontalalignment='left',
@@ -325,51 +399,8 @@ def _plot_saliency_one_example(
                 zorder=1e10
             )
 
-        output_file_name = '{0:s}/{1:s}_vector-predictor-set-{2:d}.jpg'.format(
-            output_dir_name, example_id_string.replace('_', '-'), k
-        )
-        figure_object = handle_dict[profile_plotting.FIGURE_HANDLE_KEY]
-
-        print('Saving figure to: "{0:s}"...'.format(output_file_name))
-        figure_object.savefig(
-            output_file_name, dpi=FIGURE_RESOLUTION_DPI, pad_inches=0,
-            bbox_inches='tight'
-        )
-        pyplot.close(figure_object)
-
-    if num_scalar_dim == 1:
-        return
-
-    num_predictor_sets = len(SCALAR_PREDICTOR_NAMES_BY_SET)
-
-    for k in range(num_predictor_sets):
-        these_flags = numpy.array([
-            n in example_dict[example_utils.SCALAR_PREDICTOR_NAMES_KEY]
-            for n in SCALAR_PREDICTOR_NAMES_BY_SET[k]
-        ], dtype=bool)
-
-        these_indices = numpy.where(these_flags)[0]
-        if len(these_indices) == 0:
-            continue
-
-        predictor_names = [
-            SCALAR_PREDICTOR_NAMES_BY_SET[k][i] for i in these_indices
-        ]
-        predictor_colours = [
-            SCALAR_PREDICTOR_COLOURS_BY_SET[k][i] for i in these_indices
-        ]
-
-        handle_dict = profile_plotting.plot_predictors(
-            example_dict=example_dict, example_index=0,
-            predictor_names=predictor_names,
-            predictor_colours=predictor_colours,
-            predictor_line_widths=numpy.full(len(these_indices), 2),
-            predictor_line_styles=['solid'] * len(these_indices),
-            use_log_scale=use_log_scale, include_units=False, handle_dict=None
-        )
-
-        output_file_name = '{0:s}/{1:s}_scalar-predictor-set-{2:d}.jpg'.format(
-            output_dir_name, example_id_string.replace('_', '-'), k
+        output_file_name = '{0:s}/{1:s}_{2:s}.jpg'.format(
+            output_dir_name, file_name_id_string, file_labels[k]
         )
         figure_object = handle_dict[profile_plotting.FIGURE_HANDLE_KEY]
 
@@ -378,11 +409,10 @@ def _plot_saliency_one_example(
             output_file_name, dpi=FIGURE_RESOLUTION_DPI, pad_inches=0,
             bbox_inches='tight'
         )
-        pyplot.close(figure_object)
 
 
 def _run(saliency_file_name, use_log_scale, prediction_file_name,
-         output_dir_name):
+         first_example_index, num_examples_to_plot, output_dir_name):
     """Plots saliency maps (one for each example).
 
     This is effectively the main method.
@@ -390,6 +420,8 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
     :param saliency_file_name: See documentation at top of file.
     :param use_log_scale: Same.
     :param prediction_file_name: Same.
+    :param first_example_index: Same.
+    :param num_examples_to_plot: Same.
     :param output_dir_name: Same.
     """
 
@@ -403,6 +435,23 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
     target_field_name = saliency_dict[saliency.TARGET_FIELD_KEY]
     target_height_m_agl = saliency_dict[saliency.TARGET_HEIGHT_KEY]
     example_id_strings = saliency_dict[saliency.EXAMPLE_IDS_KEY]
+
+    num_examples_total = len(example_id_strings)
+    error_checking.assert_is_geq(first_example_index, 0)
+    error_checking.assert_is_less_than(first_example_index, num_examples_total)
+
+    if num_examples_to_plot <= 0:
+        num_examples_to_plot = num_examples_total
+
+    last_example_index = numpy.minimum(
+        first_example_index + num_examples_to_plot, num_examples_total
+    )
+    example_indices = numpy.linspace(
+        first_example_index, last_example_index - 1,
+        num=last_example_index - first_example_index, dtype=int
+    )
+    example_id_strings = [example_id_strings[j] for j in example_indices]
+
     model_file_name = saliency_dict[saliency.MODEL_FILE_KEY]
     model_metafile_name = neural_net.find_metafile(
         model_dir_name=os.path.split(model_file_name)[0]
@@ -410,9 +459,16 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
 
     print('Reading model metadata from: "{0:s}"...'.format(model_metafile_name))
     model_metadata_dict = neural_net.read_metafile(model_metafile_name)
+    vector_indices_by_set, scalar_indices_by_set = _find_predictors_by_set(
+        model_metadata_dict
+    )
     num_examples = len(example_id_strings)
 
-    if target_field_name is None or prediction_file_name == '':
+    read_target_values = not (
+        target_field_name is None or prediction_file_name in [None, '']
+    )
+
+    if not read_target_values:
         predicted_target_values = [None] * num_examples
         actual_target_values = [None] * num_examples
     else:
@@ -426,8 +482,11 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
 
     print(SEPARATOR_STRING)
 
+    # Figures are reused across examples, since creating one is expensive.
+    handle_dict_by_num_predictors = dict()
+
     for i in range(num_examples):
-        if target_field_name is None:
+        if not read_target_values:
             this_legend_suffix = ''
         else:
             this_height_string = (
@@ -443,8 +502,11 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
             )
 
         _plot_saliency_one_example(
-            saliency_dict=saliency_dict, example_index=i,
+            saliency_dict=saliency_dict, example_index=example_indices[i],
             model_metadata_dict=model_metadata_dict,
+            vector_indices_by_set=vector_indices_by_set,
+            scalar_indices_by_set=scalar_indices_by_set,
+            handle_dict_by_num_predictors=handle_dict_by_num_predictors,
             use_log_scale=use_log_scale,
             legend_suffix=this_legend_suffix, output_dir_name=output_dir_name
         )
@@ -452,6 +514,9 @@ def _run(saliency_file_name, use_log_scale, prediction_file_name,
         if i != num_examples - 1:
             print('\n')
 
+    for this_handle_dict in handle_dict_by_num_predictors.values():
+        pyplot.close(this_handle_dict[profile_plotting.FIGURE_HANDLE_KEY])
+
 
 if __name__ == '__main__':
     INPUT_ARG_OBJECT = INPUT_ARG_PARSER.parse_args()
@@ -462,5 +527,7 @@ if __name__ == '__main__':
         prediction_file_name=getattr(
             INPUT_ARG_OBJECT, PREDICTION_FILE_ARG_NAME
         ),
+        first_example_index=getattr(INPUT_ARG_OBJECT, FIRST_EXAMPLE_ARG_NAME),
+        num_examples_to_plot=getattr(INPUT_ARG_OBJECT, NUM_EXAMPLES_ARG_NAME),
         output_dir_name=getattr(INPUT_ARG_OBJECT, OUTPUT_DIR_ARG_NAME)
     )
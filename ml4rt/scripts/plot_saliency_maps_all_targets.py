@@ -147,7 +147,8 @@ def _plot_saliency_scalar_p_scalar_t(
     )
     axes_object.imshow(
         numpy.transpose(saliency_matrix), cmap=colour_map_object,
-        vmin=min_colour_value, vmax=max_colour_value, origin='lower'
+        vmin=min_colour_value, vmax=max_colour_value, origin='lower',
+        interpolation='nearest'
     )
 
     num_predictors = len(predictor_names)
@@ -258,7 +259,8 @@ def _plot_saliency_vector_p_scalar_t(
         )
         axes_object.imshow(
             saliency_matrix[..., k], cmap=colour_map_object,
-            vmin=min_colour_value, vmax=max_colour_value, origin='lower'
+            vmin=min_colour_value, vmax=max_colour_value, origin='lower',
+            interpolation='nearest'
         )
 
         x_tick_values = numpy.linspace(
@@ -365,7 +367,8 @@ def _plot_saliency_scalar_p_vector_t(
 
         axes_object.imshow(
             numpy.transpose(saliency_matrix[..., k]), cmap=colour_map_object,
-            vmin=min_colour_value, vmax=max_colour_value, origin='lower'
+            vmin=min_colour_value, vmax=max_colour_value, origin='lower',
+            interpolation='nearest'
         )
 
         x_tick_values = numpy.linspace(
@@ -474,7 +477,7 @@ def _plot_saliency_vector_p_vector_t(
             axes_object.imshow(
                 numpy.transpose(saliency_matrix[:, j, :, k]),
                 cmap=colour_map_object, vmin=min_colour_value,
-                vmax=max_colour_value, origin='lower'
+                vmax=max_colour_value, origin='lower', interpolation='nearest'
             )
 
             tick_values = numpy.linspace(
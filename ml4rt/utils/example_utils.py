@@ -640,15 +640,11 @@ def fluxes_actual_to_increments(example_dict):
     edge_heights_m_agl = get_grid_cell_edges(example_dict[HEIGHTS_KEY])
     grid_cell_widths_metres = get_grid_cell_widths(edge_heights_m_agl)
 
-    num_examples = len(example_dict[VALID_TIMES_KEY])
+    # Broadcasting over examples avoids building a full E-by-H width matrix.
     num_heights = len(example_dict[HEIGHTS_KEY])
-
     grid_cell_width_matrix_metres = numpy.reshape(
         grid_cell_widths_metres, (1, num_heights)
     )
-    grid_cell_width_matrix_metres = numpy.repeat(
-        grid_cell_width_matrix_metres, repeats=num_examples, axis=0
-    )
 
     down_flux_matrix_w_m02 = get_field_from_dict(
         example_dict=example_dict, field_name=SHORTWAVE_DOWN_FLUX_NAME
@@ -723,15 +719,10 @@ def fluxes_increments_to_actual(example_dict):
     edge_heights_m_agl = get_grid_cell_edges(example_dict[HEIGHTS_KEY])
     grid_cell_widths_metres = get_grid_cell_widths(edge_heights_m_agl)
 
-    num_examples = len(example_dict[VALID_TIMES_KEY])
     num_heights = len(example_dict[HEIGHTS_KEY])
-
     grid_cell_width_matrix_metres = numpy.reshape(
         grid_cell_widths_metres, (1, num_heights)
     )
-    grid_cell_width_matrix_metres = numpy.repeat(
-        grid_cell_width_matrix_metres, repeats=num_examples, axis=0
-    )
 
     down_flux_increment_matrix_w_m03 = get_field_from_dict(
         example_dict=example_dict, field_name=SHORTWAVE_DOWN_FLUX_INC_NAME
@@ -1267,39 +1258,47 @@ def find_cloud_layers(example_dict, min_path_kg_m02, for_ice=False):
         )
 
     path_diff_matrix_kg_m02 = numpy.diff(path_matrix_kg_m02, axis=1, prepend=0.)
+    num_examples, num_heights = path_diff_matrix_kg_m02.shape
+
+    # Find non-zero runs (candidate layers) in all profiles at once.  Appending
+    # a zero to each profile before flattening keeps runs from crossing
+    # profiles.  Each run goes from start index (inclusive) to end index
+    # (exclusive).
+    flat_path_diffs_kg_m02 = numpy.ravel(numpy.pad(
+        path_diff_matrix_kg_m02, pad_width=((0, 0), (0, 1)),
+        mode='constant', constant_values=0.
+    ))
+    flat_start_indices, flat_end_indices = _find_nonzero_runs(
+        flat_path_diffs_kg_m02
+    )
+    flat_end_indices += 1
 
-    num_examples = path_matrix_kg_m02.shape[0]
-    cloud_mask_matrix = numpy.full(path_matrix_kg_m02.shape, False, dtype=bool)
-    cloud_layer_counts = numpy.full(num_examples, 0, dtype=int)
-
-    for i in range(num_examples):
-        these_diffs = path_diff_matrix_kg_m02[i, :] + 0.
-
-        if for_ice:
-            these_diffs[these_diffs <= 1e9] = 0
-        else:
-            these_diffs[these_diffs <= 1e6] = 0
+    example_indices, start_indices = numpy.divmod(
+        flat_start_indices, num_heights + 1
+    )
+    end_indices = flat_end_indices - example_indices * (num_heights + 1)
 
-        these_start_indices, these_end_indices = _find_nonzero_runs(
-            path_diff_matrix_kg_m02[i, :]
-        )
+    # Sum path over each run.
+    boundary_indices = numpy.ravel(
+        numpy.stack((flat_start_indices, flat_end_indices), axis=1)
+    )
+    layer_paths_kg_m02 = numpy.add.reduceat(
+        flat_path_diffs_kg_m02, boundary_indices
+    )[::2]
 
-        this_num_layers = len(these_start_indices)
+    good_flags = layer_paths_kg_m02 >= min_path_kg_m02
+    example_indices = example_indices[good_flags]
+    start_indices = start_indices[good_flags]
+    end_indices = end_indices[good_flags]
 
-        for j in range(this_num_layers):
-            this_path_kg_m02 = numpy.sum(
-                path_diff_matrix_kg_m02[
-                    i, these_start_indices[j]:(these_end_indices[j] + 1)
-                ]
-            )
-
-            if this_path_kg_m02 < min_path_kg_m02:
-                continue
+    cloud_layer_counts = numpy.bincount(
+        example_indices, minlength=num_examples
+    ).astype(int)
 
-            cloud_layer_counts[i] += 1
-            cloud_mask_matrix[
-                i, these_start_indices[j]:(these_end_indices[j] + 1)
-            ] = True
+    marker_matrix = numpy.full((num_examples, num_heights + 1), 0, dtype=int)
+    marker_matrix[example_indices, start_indices] = 1
+    marker_matrix[example_indices, end_indices] = -1
+    cloud_mask_matrix = numpy.cumsum(marker_matrix, axis=1)[:, :-1] > 0
 
     return cloud_mask_matrix, cloud_layer_counts
 
@@ -1598,6 +1597,33 @@ def parse_example_ids(example_id_strings):
     }
 
 
+def example_ids_to_valid_times(example_id_strings):
+    """Extracts valid time from each example ID.
+
+    This is faster than `parse_example_ids`, because it parses only valid times.
+
+    E = number of examples
+
+    :param example_id_strings: length-E list of example IDs, in format required
+        by `parse_example_ids`.
+    :return: valid_times_unix_sec: length-E numpy array of valid times.
+    """
+
+    error_checking.assert_is_numpy_array(
+        numpy.array(example_id_strings), num_dimensions=1
+    )
+
+    num_examples = len(example_id_strings)
+    valid_times_unix_sec = numpy.full(num_examples, -1, dtype=int)
+
+    for i in range(num_examples):
+        this_word = example_id_strings[i].split('_')[3]
+        assert this_word.startswith('time=')
+        valid_times_unix_sec[i] = int(this_word.replace('time=', ''))
+
+    return valid_times_unix_sec
+
+
 def get_field_from_dict(example_dict, field_name, height_m_agl=None):
     """Returns field from dictionary of examples.
 
@@ -1949,6 +1975,17 @@ def find_examples_with_time_tolerance(
     ]
     desired_id_strings_no_time_numpy = numpy.array(desired_id_strings_no_time)
 
+    # Group examples by everything except time, so that each desired example is
+    # compared only with examples that match in everything except time, rather
+    # than with all examples.
+    no_time_string_to_indices = dict()
+
+    for j, this_string in enumerate(all_id_strings_no_time):
+        if this_string not in no_time_string_to_indices:
+            no_time_string_to_indices[this_string] = []
+
+        no_time_string_to_indices[this_string].append(j)
+
     num_desired_examples = len(desired_id_strings)
     desired_indices = numpy.full(num_desired_examples, -1, dtype=int)
 
@@ -1961,25 +1998,26 @@ def find_examples_with_time_tolerance(
                 i, num_desired_examples, time_tolerance_sec
             ))
 
-        these_time_diffs_sec = numpy.absolute(
-            all_times_unix_sec - desired_times_unix_sec[i]
+        these_indices = numpy.array(
+            no_time_string_to_indices.get(desired_id_strings_no_time[i], []),
+            dtype=int
         )
-        these_indices = numpy.where(
-            these_time_diffs_sec <= time_tolerance_sec
-        )[0]
 
         if len(these_indices) == 0:
             continue
 
+        these_time_diffs_sec = numpy.absolute(
+            all_times_unix_sec[these_indices] - desired_times_unix_sec[i]
+        )
         these_subindices = numpy.where(
-            all_id_strings_no_time_numpy[these_indices] ==
-            desired_id_strings_no_time[i]
+            these_time_diffs_sec <= time_tolerance_sec
         )[0]
 
         if len(these_subindices) == 0:
             continue
 
         these_indices = these_indices[these_subindices]
+        these_time_diffs_sec = these_time_diffs_sec[these_subindices]
 
         if len(these_subindices) == 1:
             desired_indices[i] = these_indices[0]
@@ -1997,7 +2035,7 @@ def find_examples_with_time_tolerance(
             else:
                 raise ValueError(error_string)
 
-            sort_indices = numpy.argsort(these_time_diffs_sec[these_indices])
+            sort_indices = numpy.argsort(these_time_diffs_sec)
             desired_indices[i] = these_indices[sort_indices[0]]
 
     if verbose:
@@ -2054,17 +2092,24 @@ def find_examples(all_id_strings, desired_id_strings, allow_missing=False):
     all_id_strings_numpy = numpy.array(all_id_strings)
     desired_id_strings_numpy = numpy.array(desired_id_strings)
 
-    these_unique_strings, these_counts = numpy.unique(
-        all_id_strings_numpy, return_counts=True
+    # Sort all IDs only once.  The sorted array is used both to find repeated
+    # entries and to find desired IDs.
+    sort_indices = numpy.argsort(all_id_strings_numpy)
+    sorted_all_id_strings_numpy = all_id_strings_numpy[sort_indices]
+
+    repeat_flags = (
+        sorted_all_id_strings_numpy[1:] == sorted_all_id_strings_numpy[:-1]
     )
-    if numpy.any(these_counts > 1):
-        these_indices = numpy.where(these_counts > 1)[0]
+    if numpy.any(repeat_flags):
+        these_repeated_strings = numpy.unique(
+            sorted_all_id_strings_numpy[1:][repeat_flags]
+        )
 
         error_string = (
             '\nall_id_strings contains {0:d} repeated entries, listed below:'
             '\n{1:s}'
         ).format(
-            len(these_indices), str(these_unique_strings[these_indices])
+            len(these_repeated_strings), str(these_repeated_strings)
         )
         raise ValueError(error_string)
 
@@ -2082,10 +2127,8 @@ def find_examples(all_id_strings, desired_id_strings, allow_missing=False):
         )
         raise ValueError(error_string)
 
-    sort_indices = numpy.argsort(all_id_strings_numpy)
     desired_indices = numpy.searchsorted(
-        all_id_strings_numpy[sort_indices], desired_id_strings_numpy,
-        side='left'
+        sorted_all_id_strings_numpy, desired_id_strings_numpy, side='left'
     ).astype(int)
 
     desired_indices = numpy.maximum(desired_indices, 0)
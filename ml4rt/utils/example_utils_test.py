@@ -14,7 +14,7 @@ FIRST_VALUES = numpy.full(10, 0.)
 FIRST_START_INDICES = numpy.array([], dtype=int)
 FIRST_END_INDICES = numpy.array([], dtype=int)
 
-SECOND_VALUES = numpy.random.uniform(low=-5., high=5., size=10)
+SECOND_VALUES = numpy.random.default_rng(0).uniform(low=-5., high=5., size=10)
 SECOND_VALUES[numpy.absolute(SECOND_VALUES) < TOLERANCE] = 1.
 SECOND_START_INDICES = numpy.array([0], dtype=int)
 SECOND_END_INDICES = numpy.array([9], dtype=int)
@@ -418,13 +418,13 @@ THESE_VECTOR_TARGET_NAMES = [
     example_utils.SHORTWAVE_UP_FLUX_NAME, example_utils.SHORTWAVE_DOWN_FLUX_NAME
 ]
 
+THIS_VECTOR_PREDICTOR_MATRIX.setflags(write=False)
+THIS_VECTOR_TARGET_MATRIX.setflags(write=False)
 EXAMPLE_DICT_FLUXES_ONLY = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX + 0.,
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
-    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX + 0.,
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX,
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
+    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX,
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
     example_utils.HEIGHTS_KEY: THESE_HEIGHTS_M_AGL
 }
@@ -440,13 +440,13 @@ THESE_VECTOR_TARGET_NAMES = [
     example_utils.SHORTWAVE_HEATING_RATE_NAME
 ]
 
+THIS_VECTOR_PREDICTOR_MATRIX.setflags(write=False)
+THIS_VECTOR_TARGET_MATRIX.setflags(write=False)
 EXAMPLE_DICT_WITH_HEATING_RATE = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX + 0.,
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
-    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX + 0.,
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX,
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
+    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX,
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
     example_utils.HEIGHTS_KEY: THESE_HEIGHTS_M_AGL
 }
@@ -482,13 +482,13 @@ THESE_VECTOR_TARGET_NAMES = [
     example_utils.SHORTWAVE_UP_FLUX_INC_NAME
 ]
 
+THIS_VECTOR_PREDICTOR_MATRIX.setflags(write=False)
+THIS_VECTOR_TARGET_MATRIX.setflags(write=False)
 EXAMPLE_DICT_WITH_INCREMENTS = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX + 0.,
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
-    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX + 0.,
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX,
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
+    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX,
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
     example_utils.HEIGHTS_KEY: THESE_HEIGHTS_M_AGL
 }
@@ -602,50 +602,56 @@ FIRST_EXAMPLE_DICT = {
 }
 
 SECOND_EXAMPLE_ID_STRINGS = ['FOO', 'BAR', 'MOO', 'HAL']
+SECOND_SCALAR_PREDICTOR_MATRIX = FIRST_SCALAR_PREDICTOR_MATRIX * 2
+SECOND_VECTOR_PREDICTOR_MATRIX = FIRST_VECTOR_PREDICTOR_MATRIX * 3
+SECOND_SCALAR_TARGET_MATRIX = FIRST_SCALAR_TARGET_MATRIX * 4
+SECOND_VECTOR_TARGET_MATRIX = FIRST_VECTOR_TARGET_MATRIX * 5
+SECOND_TIMES_UNIX_SEC = FIRST_TIMES_UNIX_SEC * 6
+SECOND_STANDARD_ATMO_FLAGS = FIRST_STANDARD_ATMO_FLAGS + 1
 
 SECOND_EXAMPLE_DICT = {
     example_utils.SCALAR_PREDICTOR_NAMES_KEY: SCALAR_PREDICTOR_NAMES,
-    example_utils.SCALAR_PREDICTOR_VALS_KEY: FIRST_SCALAR_PREDICTOR_MATRIX * 2,
+    example_utils.SCALAR_PREDICTOR_VALS_KEY: SECOND_SCALAR_PREDICTOR_MATRIX,
     example_utils.VECTOR_PREDICTOR_NAMES_KEY: VECTOR_PREDICTOR_NAMES,
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: FIRST_VECTOR_PREDICTOR_MATRIX * 3,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: SECOND_VECTOR_PREDICTOR_MATRIX,
     example_utils.SCALAR_TARGET_NAMES_KEY: SCALAR_TARGET_NAMES,
-    example_utils.SCALAR_TARGET_VALS_KEY: FIRST_SCALAR_TARGET_MATRIX * 4,
+    example_utils.SCALAR_TARGET_VALS_KEY: SECOND_SCALAR_TARGET_MATRIX,
     example_utils.VECTOR_TARGET_NAMES_KEY: VECTOR_TARGET_NAMES,
-    example_utils.VECTOR_TARGET_VALS_KEY: FIRST_VECTOR_TARGET_MATRIX * 5,
+    example_utils.VECTOR_TARGET_VALS_KEY: SECOND_VECTOR_TARGET_MATRIX,
     example_utils.HEIGHTS_KEY: HEIGHTS_M_AGL,
-    example_utils.VALID_TIMES_KEY: FIRST_TIMES_UNIX_SEC * 6,
-    example_utils.STANDARD_ATMO_FLAGS_KEY: FIRST_STANDARD_ATMO_FLAGS + 1,
+    example_utils.VALID_TIMES_KEY: SECOND_TIMES_UNIX_SEC,
+    example_utils.STANDARD_ATMO_FLAGS_KEY: SECOND_STANDARD_ATMO_FLAGS,
     example_utils.EXAMPLE_IDS_KEY: SECOND_EXAMPLE_ID_STRINGS
 }
 
 CONCAT_EXAMPLE_DICT = {
     example_utils.SCALAR_PREDICTOR_NAMES_KEY: SCALAR_PREDICTOR_NAMES,
     example_utils.SCALAR_PREDICTOR_VALS_KEY: numpy.concatenate(
-        (FIRST_SCALAR_PREDICTOR_MATRIX, FIRST_SCALAR_PREDICTOR_MATRIX * 2),
+        (FIRST_SCALAR_PREDICTOR_MATRIX, SECOND_SCALAR_PREDICTOR_MATRIX),
         axis=0
     ),
     example_utils.VECTOR_PREDICTOR_NAMES_KEY: VECTOR_PREDICTOR_NAMES,
     example_utils.VECTOR_PREDICTOR_VALS_KEY: numpy.concatenate(
-        (FIRST_VECTOR_PREDICTOR_MATRIX, FIRST_VECTOR_PREDICTOR_MATRIX * 3),
+        (FIRST_VECTOR_PREDICTOR_MATRIX, SECOND_VECTOR_PREDICTOR_MATRIX),
         axis=0
     ),
     example_utils.SCALAR_TARGET_NAMES_KEY: SCALAR_TARGET_NAMES,
     example_utils.SCALAR_TARGET_VALS_KEY: numpy.concatenate(
-        (FIRST_SCALAR_TARGET_MATRIX, FIRST_SCALAR_TARGET_MATRIX * 4),
+        (FIRST_SCALAR_TARGET_MATRIX, SECOND_SCALAR_TARGET_MATRIX),
         axis=0
     ),
     example_utils.VECTOR_TARGET_NAMES_KEY: VECTOR_TARGET_NAMES,
     example_utils.VECTOR_TARGET_VALS_KEY: numpy.concatenate(
-        (FIRST_VECTOR_TARGET_MATRIX, FIRST_VECTOR_TARGET_MATRIX * 5),
+        (FIRST_VECTOR_TARGET_MATRIX, SECOND_VECTOR_TARGET_MATRIX),
         axis=0
     ),
     example_utils.HEIGHTS_KEY: HEIGHTS_M_AGL,
     example_utils.VALID_TIMES_KEY: numpy.concatenate(
-        (FIRST_TIMES_UNIX_SEC, FIRST_TIMES_UNIX_SEC * 6),
+        (FIRST_TIMES_UNIX_SEC, SECOND_TIMES_UNIX_SEC),
         axis=0
     ),
     example_utils.STANDARD_ATMO_FLAGS_KEY: numpy.concatenate(
-        (FIRST_STANDARD_ATMO_FLAGS, FIRST_STANDARD_ATMO_FLAGS + 1),
+        (FIRST_STANDARD_ATMO_FLAGS, SECOND_STANDARD_ATMO_FLAGS),
         axis=0
     ),
     example_utils.EXAMPLE_IDS_KEY:
@@ -857,8 +863,8 @@ FIRST_EXAMPLE_DICT_AVERAGE = {
     example_utils.HEIGHTS_KEY: HEIGHTS_M_AGL
 }
 
-# The following constants are used to test create_example_ids and
-# parse_example_ids.
+# The following constants are used to test create_example_ids,
+# parse_example_ids, and example_ids_to_valid_times.
 LATITUDES_FOR_ID_DEG_N = numpy.array([40, 40.04, 53.5, 40.0381113])
 LONGITUDES_FOR_ID_DEG_E = numpy.array([255, 254.74, 246.5, 254.7440276])
 ZENITH_ANGLES_FOR_ID_RAD = numpy.array([0.5, 0.666, 0.7777777, 1])
@@ -928,11 +934,13 @@ EXAMPLE_ID_STRINGS = [
 REAL_HEIGHTS_M_AGL = numpy.array(
     [10, 20, 40, 60, 80, 10000, 50000], dtype=float
 )
+REAL_HEIGHTS_M_AGL.setflags(write=False)
 NUM_PADDING_HEIGHTS = 10
 PADDED_HEIGHTS_M_AGL = numpy.array([
     10, 20, 40, 60, 80, 10000, 50000, 1050000, 2050000, 3050000, 4050000,
     5050000, 6050000, 7050000, 8050000, 9050000, 10050000
 ], dtype=float)
+PADDED_HEIGHTS_M_AGL.setflags(write=False)
 
 # The following constants are used to test _add_height_padding.
 THIS_HUMIDITY_MATRIX_KG_KG01 = 0.001 * numpy.array([
@@ -973,15 +981,15 @@ THIS_VECTOR_TARGET_MATRIX = numpy.stack(
     (THIS_UP_FLUX_MATRIX_W_M02, THIS_DOWN_FLUX_MATRIX_W_M02), axis=-1
 )
 
+THIS_VECTOR_PREDICTOR_MATRIX.setflags(write=False)
+THIS_VECTOR_TARGET_MATRIX.setflags(write=False)
 EXAMPLE_DICT_SANS_PADDING = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX + 0.,
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
-    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX + 0.,
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX,
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
+    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX,
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
-    example_utils.HEIGHTS_KEY: REAL_HEIGHTS_M_AGL + 0.
+    example_utils.HEIGHTS_KEY: REAL_HEIGHTS_M_AGL
 }
 
 THIS_HUMIDITY_MATRIX_KG_KG01 = 0.001 * numpy.array([
@@ -1016,15 +1024,15 @@ THIS_VECTOR_TARGET_MATRIX = numpy.stack(
     (THIS_UP_FLUX_MATRIX_W_M02, THIS_DOWN_FLUX_MATRIX_W_M02), axis=-1
 )
 
+THIS_VECTOR_PREDICTOR_MATRIX.setflags(write=False)
+THIS_VECTOR_TARGET_MATRIX.setflags(write=False)
 EXAMPLE_DICT_WITH_PADDING = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
-    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX + 0.,
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
-    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX + 0.,
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
+    example_utils.VECTOR_PREDICTOR_VALS_KEY: THIS_VECTOR_PREDICTOR_MATRIX,
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
+    example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX,
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
-    example_utils.HEIGHTS_KEY: PADDED_HEIGHTS_M_AGL + 0.
+    example_utils.HEIGHTS_KEY: PADDED_HEIGHTS_M_AGL
 }
 
 # The following constants are used to test subset_by_height with padding.
@@ -1032,17 +1040,16 @@ PADDED_HEIGHTS_TO_KEEP_M_AGL = numpy.array([
     2050000, 3050000, 4050000, 5050000, 6050000, 7050000, 8050000, 9050000,
     10050000
 ], dtype=float)
+PADDED_HEIGHTS_TO_KEEP_M_AGL.setflags(write=False)
 
 EXAMPLE_DICT_PADDED_SELECT_HEIGHTS = {
-    example_utils.VECTOR_PREDICTOR_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_PREDICTOR_NAMES),
+    example_utils.VECTOR_PREDICTOR_NAMES_KEY: THESE_VECTOR_PREDICTOR_NAMES,
     example_utils.VECTOR_PREDICTOR_VALS_KEY:
         THIS_VECTOR_PREDICTOR_MATRIX[:, -9:, :],
-    example_utils.VECTOR_TARGET_NAMES_KEY:
-        copy.deepcopy(THESE_VECTOR_TARGET_NAMES),
+    example_utils.VECTOR_TARGET_NAMES_KEY: THESE_VECTOR_TARGET_NAMES,
     example_utils.VECTOR_TARGET_VALS_KEY: THIS_VECTOR_TARGET_MATRIX[:, -9:, :],
     example_utils.VALID_TIMES_KEY: VALID_TIMES_UNIX_SEC,
-    example_utils.HEIGHTS_KEY: PADDED_HEIGHTS_TO_KEEP_M_AGL + 0.
+    example_utils.HEIGHTS_KEY: PADDED_HEIGHTS_TO_KEEP_M_AGL
 }
 
 
@@ -1670,6 +1677,16 @@ class ExampleUtilsTests(unittest.TestCase):
             atol=TOLERANCE
         ))
 
+    def test_example_ids_to_valid_times(self):
+        """Ensures correct output from example_ids_to_valid_times."""
+
+        these_times_unix_sec = example_utils.example_ids_to_valid_times(
+            EXAMPLE_ID_STRINGS
+        )
+        self.assertTrue(numpy.array_equal(
+            these_times_unix_sec, TIMES_FOR_ID_UNIX_SEC
+        ))
+
     def test_create_fake_heights(self):
         """Ensures correct output from create_fake_heights."""
 
@@ -85,10 +85,9 @@ def read_example_ids_from_netcdf(netcdf_file_name):
     """
 
     dataset_object = netCDF4.Dataset(netcdf_file_name)
-    example_id_strings = [
-        str(id) for id in
-        netCDF4.chartostring(dataset_object.variables[EXAMPLE_IDS_KEY][:])
-    ]
+    example_id_strings = netCDF4.chartostring(
+        dataset_object.variables[EXAMPLE_IDS_KEY][:]
+    ).astype('U').tolist()
     dataset_object.close()
 
     return example_id_strings
@@ -168,15 +167,14 @@ def get_examples_for_inference(
     if num_examples >= num_examples_total:
         return predictor_matrix, target_array, example_id_strings
 
-    good_indices = numpy.linspace(
-        0, num_examples_total - 1, num=num_examples_total, dtype=int
-    )
-    good_indices = numpy.random.choice(
-        good_indices, size=num_examples, replace=False
+    good_indices = numpy.random.default_rng().choice(
+        num_examples_total, size=num_examples, replace=False, shuffle=False
     )
 
     predictor_matrix = predictor_matrix[good_indices, ...]
-    example_id_strings = [example_id_strings[i] for i in good_indices]
+    example_id_strings = (
+        numpy.array(example_id_strings)[good_indices].tolist()
+    )
 
     if isinstance(target_array, list):
         target_array = [t[good_indices, ...] for t in target_array]
@@ -213,22 +211,46 @@ def get_raw_examples(
         ))
         example_id_strings = read_example_ids_from_netcdf(example_id_file_name)
 
-        valid_times_unix_sec = example_utils.parse_example_ids(
+        valid_times_unix_sec = example_utils.example_ids_to_valid_times(
             example_id_strings
-        )[example_utils.VALID_TIMES_KEY]
-
-        example_file_names = example_io.find_many_files(
-            directory_name=example_dir_name,
-            first_time_unix_sec=numpy.min(valid_times_unix_sec),
-            last_time_unix_sec=numpy.max(valid_times_unix_sec)
         )
 
-        num_files = len(example_file_names)
-        example_dicts = [dict()] * num_files
+        # Example files are organized by year, so find files only for years
+        # that contain at least one desired example, rather than every year
+        # between the first and last desired examples.
+        desired_years = numpy.unique(numpy.array([
+            int(time_conversion.unix_sec_to_string(t, '%Y'))
+            for t in numpy.unique(valid_times_unix_sec)
+        ], dtype=int))
+
+        example_file_names = []
 
-        for i in range(num_files):
-            print('Reading data from: "{0:s}"...'.format(example_file_names[i]))
-            example_dicts[i] = example_io.read_file(example_file_names[i])
+        for this_year in desired_years:
+            example_file_names += example_io.find_files_one_year(
+                directory_name=example_dir_name, year=this_year,
+                raise_error_if_missing=True
+            )
+
+        example_dicts = []
+        num_examples_read = 0
+
+        # Read only the desired examples from each file, so that the full
+        # contents of all files never need to be held in memory at once.
+        for this_file_name in example_file_names:
+            print('Reading data from: "{0:s}"...'.format(this_file_name))
+            example_dicts.append(example_io.read_file(
+                netcdf_file_name=this_file_name,
+                id_strings_to_read=example_id_strings, allow_missing_ids=True
+            ))
+
+            num_examples_read += len(
+                example_dicts[-1][example_utils.EXAMPLE_IDS_KEY]
+            )
+
+            # If all desired examples have been found, there is no need to read
+            # the remaining files.
+            if num_examples_read == len(example_id_strings):
+                break
 
         example_dict = example_utils.concat_examples(example_dicts)
 
@@ -249,18 +271,15 @@ def get_raw_examples(
         example_dict = example_io.read_file(example_file_name)
 
         num_examples_total = len(example_dict[example_utils.VALID_TIMES_KEY])
-        desired_indices = numpy.linspace(
-            0, num_examples_total - 1, num=num_examples_total, dtype=int
-        )
 
         if num_examples < num_examples_total:
-            desired_indices = numpy.random.choice(
-                desired_indices, size=num_examples, replace=False
+            desired_indices = numpy.random.default_rng().choice(
+                num_examples_total, size=num_examples, replace=False,
+                shuffle=False
+            )
+            example_dict = example_utils.subset_by_index(
+                example_dict=example_dict, desired_indices=desired_indices
             )
-
-        example_dict = example_utils.subset_by_index(
-            example_dict=example_dict, desired_indices=desired_indices
-        )
 
     return example_dict
 
@@ -18,6 +18,18 @@ More details:  The fractional calculus, K. B. Oldham, J. Spanier; 1974
 
 """
 
+import numpy as np
+from math import gamma
+
+
+def _power_table(H,alpha):
+#     """ Powers n^(alpha+1) for n = 0..H+1, shared by the RL coefficient matrices
+#        so they are looked up instead of calling pow per matrix entry.
+#
+#         return : 1D array of length H+2
+#     """
+    return np.power(np.arange(H+2,dtype=float),alpha+1)
+
 
 def RL_left_integral(data,dx,alpha):
 #     """ Computes the Reiman-Liouville fractional integral of a function at a point.
@@ -34,19 +46,22 @@ def RL_left_integral(data,dx,alpha):
         
 
 #     """
+    H = data.shape[1]
+    j = np.arange(H).reshape(-1,1)
+    k = np.arange(H).reshape(1,-1)
+
+    # Coefficient matrix: row j holds the weights of data[:,:j+1] for fractional[:,j]
+    powers = _power_table(H,alpha)
+    d = np.maximum(j-k,1)
+    coefficient = powers[d+1] - 2*powers[d] + powers[d-1]
+    coefficient[k >= j] = 0
+    coefficient[np.arange(H),np.arange(H)] = 1
+    jj = np.arange(1,H)
+    coefficient[1:,0] = powers[jj-1] - (jj-1-alpha)*np.power(jj,alpha)
+
     fractional = np.zeros_like(data)
-    
-    for j in range(1,data.shape[1]):
-        
-        coefficient = np.zeros((j+1))
-        N = j+1
-        coefficient[0] = np.power(j-1,alpha+1) - (j-1-alpha)*np.power(j,alpha)
-        coefficient[N-1] = 1
-
-        for k in range(1,N-1):
-            coefficient[k] = np.power(j-k+1,alpha+1) - 2*np.power(j-k,alpha+1) + np.power(j-k-1,alpha+1)
-            
-        fractional[:,j] = np.power(dx,alpha)*np.dot(data[:,:j+1],coefficient)/gamma(alpha+2)
+    scale = np.power(dx,alpha)/gamma(alpha+2)
+    fractional[:,1:] = scale*np.dot(data,coefficient[1:].T)
     return fractional
 
 
@@ -66,18 +81,22 @@ def rRL_right_integral(data,dx,alpha):
 #     """
 
     
+    H = data.shape[1]
+    j = np.arange(H).reshape(-1,1)
+    k = np.arange(H).reshape(1,-1)
+
+    # Coefficient matrix: row j holds the weights of data[:,j:] for fractional[:,j]
+    powers = _power_table(H,alpha)
+    d = np.maximum(k-j,1)
+    coefficient = powers[d+1] - 2*powers[d] + powers[d-1]
+    coefficient[k <= j] = 0
+    coefficient[np.arange(H),np.arange(H)] = 1
+    N = np.arange(H-1,0,-1)
+    coefficient[:H-1,H-1] = powers[N-1] - (N-1-alpha)*np.power(N,alpha)
+
     fractional = np.zeros_like(data)
-    for j in range(0,data.shape[1]-1):
-              
-        L = len(data[0,j:])
-        N = L-1
-        coefficient = np.zeros((L))
-        coefficient[0] = 1
-        coefficient[L-1] =  np.power(N-1,alpha+1) - (N-1-alpha)*np.power(N,alpha)
-
-        for k in range(1,L-1):
-            coefficient[k] = np.power(k+1,alpha+1) - 2*np.power(k,alpha+1) + np.power(k-1,alpha+1)
-        fractional[:,j] = np.power(dx,alpha)*np.dot(data[:,j:],coefficient)/gamma(alpha+2)
+    scale = np.power(dx,alpha)/gamma(alpha+2)
+    fractional[:,:H-1] = scale*np.dot(data,coefficient[:H-1].T)
     return fractional
 
 
@@ -101,15 +120,11 @@ def GL_right(data,alpha,dx):
 #     """
     length = data.shape[1]
     coeff2 = np.ones((length))
-    
-    for k in range(0,length):
-        if k == 0 :
-            coeff2[k] = 1
-        else : 
-            for i in range(1,k+1):
-                coeff2[k] *= (alpha-(i-1))/(i)
-            coeff2[k]*=np.power(-1,k)
-        
+
+    # coeff2[k] = (-1)^k * binomial(alpha,k), built with the recurrence in one cumprod
+    k = np.arange(1,length)
+    coeff2[1:] = np.cumprod(-(alpha-(k-1))/k)
+
     return np.dot(np.flip(data,axis=1),coeff2)/(dx**alpha)
 
 def GL_left(data,alpha,dx):
@@ -132,13 +147,9 @@ def GL_left(data,alpha,dx):
 #     """
     length =data.shape[1]
     coeff2 = np.ones((length))
-    
-    for k in range(0,length):
-        if k == 0 :
-            coeff2[k] = 1
-        else:
-            for i in range(1,k+1):
-                coeff2[k] *= (alpha-(i-1))/(i)
-            coeff2[k]*=np.power(-1,k)
+
+    # coeff2[k] = (-1)^k * binomial(alpha,k), built with the recurrence in one cumprod
+    k = np.arange(1,length)
+    coeff2[1:] = np.cumprod(-(alpha-(k-1))/k)
     return np.dot(data,coeff2)/(dx**alpha)
 